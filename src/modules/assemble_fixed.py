@@ -5,11 +5,14 @@ Addresses critical issues: 5-second videos and missing audio
 """
 
 import os
+import shutil
 import subprocess
 import json
 from pathlib import Path
 import logging
 
+from .clip_library import normalize_clips
+
 logger = logging.getLogger(__name__)
 
 class VideoAssembler:
@@ -48,11 +51,17 @@ class VideoAssembler:
         if not video_clips:
             raise ValueError("No video clips provided")
         
-        concat_file = self.temp_dir / "concat_list.txt"
+        # Normalize to MPEG-TS so the loop can be built by byte concatenation
+        ts_clips = normalize_clips([Path(clip) for clip in video_clips], container='ts')
+        if any(clip.suffix != '.ts' for clip in ts_clips):
+            logger.warning("Some clips could not be normalized, using concat demuxer")
+            ts_clips = None
+        
+        clips = ts_clips or video_clips
         total_clips_duration = 0
         
         # Calculate total duration of all clips
-        for clip in video_clips:
+        for clip in clips:
             total_clips_duration += self.get_video_duration(clip)
         
         if total_clips_duration == 0:
@@ -61,6 +70,18 @@ class VideoAssembler:
         # Calculate how many times we need to repeat the sequence
         repeat_count = max(1, int(target_duration / total_clips_duration) + 1)
         
+        if ts_clips:
+            # MPEG-TS segments can be joined with a plain byte copy, no remux pass
+            concat_output = self.temp_dir / "concatenated.ts"
+            with open(concat_output, 'wb') as out:
+                for _ in range(repeat_count):
+                    for clip in ts_clips:
+                        with open(clip, 'rb') as f:
+                            shutil.copyfileobj(f, out, 1024 * 1024)
+            return concat_output
+        
+        concat_file = self.temp_dir / "concat_list.txt"
+        
         # Create concatenation file
         with open(concat_file, 'w') as f:
             for _ in range(repeat_count):
@@ -105,12 +126,14 @@ class VideoAssembler:
         concat_video = self.create_concatenated_video(video_clips, audio_duration)
         
         # Step 3: Combine video and audio with precise duration control
+        # Normalized TS video is already H.264 and only needs remuxing
+        video_codec = 'copy' if concat_video.suffix == '.ts' else 'libx264'
         cmd = [
             'ffmpeg', '-y',
             '-i', str(concat_video),  # Video input
             '-i', str(audio_path),    # Audio input
             '-t', str(audio_duration),  # Set exact duration to match audio
-            '-c:v', 'libx264',        # Video codec
+            '-c:v', video_codec,      # Video codec
             '-c:a', 'aac',            # Audio codec
             '-b:a', '128k',           # Audio bitrate
             '-map', '0:v:0',          # Map first video stream
@@ -156,7 +179,6 @@ class VideoAssembler:
         """Remove temporary files"""
         try:
             if self.temp_dir.exists():
-                import shutil
                 shutil.rmtree(self.temp_dir)
                 self.temp_dir.mkdir(exist_ok=True)  # Recreate empty dir
         except Exception as e:
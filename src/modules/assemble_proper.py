@@ -1,5 +1,7 @@
 """Proper video assembly using actual video clips with ffmpeg"""
 
+import asyncio
+import math
 import subprocess
 import json
 from typing import Dict, Any, Optional, Tuple, List
@@ -8,6 +10,9 @@ from datetime import datetime
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
+from ..utils.ffmpeg_utils import FFMPEG, parse_progress_duration, run_ffmpeg
+from ..utils.probe_cache import get_probe_cache
+from .clip_library import normalize_library
 
 
 class ProperVideoAssembler:
@@ -25,6 +30,17 @@ class ProperVideoAssembler:
                       output_dir: Path,
                       script: Optional[Dict[str, Any]] = None,
                       thumbnail_path: Optional[Path] = None) -> Tuple[Path, Dict[str, Any]]:
+        """Synchronous wrapper around assemble_video_async."""
+        return asyncio.run(self.assemble_video_async(
+            audio_path, clips_dir, output_dir, script, thumbnail_path
+        ))
+    
+    async def assemble_video_async(self,
+                                   audio_path: Path,
+                                   clips_dir: Path, 
+                                   output_dir: Path,
+                                   script: Optional[Dict[str, Any]] = None,
+                                   thumbnail_path: Optional[Path] = None) -> Tuple[Path, Dict[str, Any]]:
         """Assemble video using actual video clips."""
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -38,8 +54,8 @@ class ProperVideoAssembler:
             return output_path, {"duration_seconds": 5.0, "method": "mock"}
             
         try:
-            # Get all video clips
-            clips = sorted(clips_dir.glob('*.mp4'))
+            # Get all video clips, normalized so the concat demuxer can stream copy
+            clips = await asyncio.to_thread(normalize_library, clips_dir)
             if not clips:
                 self.logger.error("No video clips found!")
                 raise Exception("No video clips in clips directory")
@@ -55,11 +71,15 @@ class ProperVideoAssembler:
             
             # Create concat file list
             concat_list = output_dir / 'concat_list.txt'
+            # Probe actual clip durations (cached) instead of assuming ~5s each
+            durations = await asyncio.gather(
+                *(asyncio.to_thread(self._get_duration, clip) for clip in clips)
+            )
+            total_clip_duration = sum(durations) or len(clips) * 5.0
+            
             with open(concat_list, 'w') as f:
                 # Calculate how many times to loop clips
-                clip_duration = 5.0  # Each clip is ~5 seconds
-                total_clip_duration = len(clips) * clip_duration
-                loops_needed = int(audio_duration / total_clip_duration) + 1
+                loops_needed = max(1, math.ceil(audio_duration / total_clip_duration))
                 
                 self.logger.info(f"Looping {len(clips)} clips {loops_needed} times for {audio_duration}s audio")
                 
@@ -72,7 +92,7 @@ class ProperVideoAssembler:
             # Step 1: Concatenate all clips
             self.logger.info("Concatenating video clips...")
             concat_cmd = [
-                'ffmpeg',
+                FFMPEG,
                 '-f', 'concat',
                 '-safe', '0',
                 '-i', str(concat_list),
@@ -82,7 +102,7 @@ class ProperVideoAssembler:
                 '-y'
             ]
             
-            result = subprocess.run(concat_cmd, capture_output=True, text=True, timeout=120)
+            result = await run_ffmpeg(concat_cmd, timeout=120)
             if result.returncode != 0:
                 self.logger.error(f"Concat failed: {result.stderr[-500:]}")
                 
@@ -99,7 +119,7 @@ class ProperVideoAssembler:
                 filter_str += f'concat=n={len(clips[:20])}:v=1:a=1[outv][outa]'
                 
                 alt_concat_cmd = [
-                    'ffmpeg'
+                    FFMPEG
                 ] + input_args + [
                     '-filter_complex', filter_str,
                     '-map', '[outv]',
@@ -113,7 +133,7 @@ class ProperVideoAssembler:
                     '-y'
                 ]
                 
-                result = subprocess.run(alt_concat_cmd, capture_output=True, text=True, timeout=180)
+                result = await run_ffmpeg(alt_concat_cmd, timeout=180)
                 if result.returncode != 0:
                     raise Exception(f"Both concat methods failed: {result.stderr[-200:]}")
             
@@ -147,7 +167,7 @@ class ProperVideoAssembler:
                     title_safe = '\\n'.join(lines[:3])  # Max 3 lines
                 
                 final_cmd = [
-                    'ffmpeg',
+                    FFMPEG,
                     '-i', str(concat_video),
                     '-i', str(audio_path),
                     '-filter_complex', 
@@ -160,13 +180,15 @@ class ProperVideoAssembler:
                     '-c:a', 'copy',  # Copy audio without re-encoding
                     '-t', str(audio_duration),  # Use full audio duration
                     '-movflags', '+faststart',
+                    '-progress', 'pipe:2',  # Report output duration without re-probing
+                    '-nostats',
                     str(output_path),
                     '-y'
                 ]
             else:
                 # No title overlay
                 final_cmd = [
-                    'ffmpeg',
+                    FFMPEG,
                     '-i', str(concat_video),
                     '-i', str(audio_path),
                     '-c:v', 'libx264',
@@ -175,11 +197,13 @@ class ProperVideoAssembler:
                     '-c:a', 'copy',  # Copy audio without re-encoding
                     '-t', str(audio_duration),  # Use full audio duration
                     '-movflags', '+faststart',
+                    '-progress', 'pipe:2',  # Report output duration without re-probing
+                    '-nostats',
                     str(output_path),
                     '-y'
                 ]
             
-            result = subprocess.run(final_cmd, capture_output=True, text=True, timeout=180)
+            result = await run_ffmpeg(final_cmd, timeout=180)
             
             if result.returncode != 0:
                 self.logger.error(f"Final assembly failed: {result.stderr[-500:]}")
@@ -187,17 +211,19 @@ class ProperVideoAssembler:
                 if title:
                     self.logger.info("Retrying without title overlay...")
                     simple_cmd = [
-                        'ffmpeg',
+                        FFMPEG,
                         '-i', str(concat_video),
                         '-i', str(audio_path),
                         '-c:v', 'copy',  # Just copy video
                         '-c:a', 'copy',  # Copy audio
                         '-t', str(audio_duration),  # Full duration
                         '-movflags', '+faststart',
+                        '-progress', 'pipe:2',
+                        '-nostats',
                         str(output_path),
                         '-y'
                     ]
-                    result = subprocess.run(simple_cmd, capture_output=True, text=True, timeout=120)
+                    result = await run_ffmpeg(simple_cmd, timeout=120)
                     
                 if result.returncode != 0:
                     raise Exception("Failed to add audio")
@@ -211,8 +237,8 @@ class ProperVideoAssembler:
                 file_size_mb = output_path.stat().st_size / (1024 * 1024)
                 self.logger.info(f"Video created: {output_path} ({file_size_mb:.1f} MB)")
                 
-                # Get final video properties
-                final_duration = self._get_duration(output_path)
+                # Final duration comes from ffmpeg's progress output
+                final_duration = parse_progress_duration(result.stderr) or audio_duration
                 
                 metadata = {
                     "video_file": output_path.name,
@@ -238,17 +264,10 @@ class ProperVideoAssembler:
             output_path.touch()
             return output_path, {"error": str(e)}
     
+    def _probe_json(self, media_path: Path) -> Dict[str, Any]:
+        """Get cached ffprobe metadata for a media file"""
+        return get_probe_cache().get_probe(media_path)
+    
     def _get_duration(self, media_path: Path) -> float:
         """Get duration of audio/video file"""
-        try:
-            probe_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                str(media_path)
-            ]
-            result = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=5)
-            return float(result.stdout.strip() or '0')
-        except:
-            return 0.0
\ No newline at end of file
+        return self._probe_json(media_path).get('duration') or 0.0
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Robust video assembly - simple and reliable"""
 
-import subprocess
+import asyncio
 import random
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
@@ -8,6 +8,8 @@ from datetime import datetime
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
+from ..utils.ffmpeg_utils import FFMPEG, parse_progress_duration, run_ffmpeg
+from ..utils.probe_cache import get_probe_cache
 
 
 class RobustVideoAssembler:
@@ -25,6 +27,17 @@ class RobustVideoAssembler:
                       output_dir: Path,
                       script: Optional[Dict[str, Any]] = None,
                       thumbnail_path: Optional[Path] = None) -> Tuple[Path, Dict[str, Any]]:
+        """Synchronous wrapper around assemble_video_async."""
+        return asyncio.run(self.assemble_video_async(
+            audio_path, clips_dir, output_dir, script, thumbnail_path
+        ))
+    
+    async def assemble_video_async(self,
+                                   audio_path: Path,
+                                   clips_dir: Path, 
+                                   output_dir: Path,
+                                   script: Optional[Dict[str, Any]] = None,
+                                   thumbnail_path: Optional[Path] = None) -> Tuple[Path, Dict[str, Any]]:
         """Assemble video using simple, reliable method."""
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -43,7 +56,7 @@ class RobustVideoAssembler:
                 self.logger.warning("No clips found, using thumbnail")
                 # Fall back to thumbnail
                 if thumbnail_path and thumbnail_path.exists():
-                    return self._create_from_image(thumbnail_path, audio_path, output_path)
+                    return await self._create_from_image(thumbnail_path, audio_path, output_path)
                 else:
                     raise Exception("No video clips or thumbnail available")
             
@@ -55,15 +68,17 @@ class RobustVideoAssembler:
             # This avoids complex concatenation issues
             selected_clip = clips[0]  # Use first clip
             if len(clips) > 3:
-                # Pick a random clip from the middle ones (often better quality)
-                selected_clip = random.choice(clips[1:-1])
+                # Pick a clip from the middle ones (often better quality), seeded by
+                # post so re-runs of the same post reuse the same clip
+                rng = random.Random(script.get('post_id') if script else None)
+                selected_clip = rng.choice(clips[1:-1])
             
             self.logger.info(f"Using clip: {selected_clip.name}")
             
             # Create looped video with audio
             # IMPORTANT: Use only video from clip, audio from narration
             cmd = [
-                'ffmpeg',
+                FFMPEG,
                 '-stream_loop', '-1',  # Loop video infinitely
                 '-i', str(selected_clip),
                 '-i', str(audio_path),
@@ -77,12 +92,14 @@ class RobustVideoAssembler:
                 '-ac', '2',  # Convert to stereo for better compatibility
                 '-t', str(audio_duration),  # Trim to audio length
                 '-movflags', '+faststart',
+                '-progress', 'pipe:2',  # Report output duration without re-probing
+                '-nostats',
                 str(output_path),
                 '-y'
             ]
             
             self.logger.info("Assembling video with looped clip...")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=180)
+            result = await run_ffmpeg(cmd, timeout=180)
             
             if result.returncode != 0:
                 self.logger.error(f"Assembly failed: {result.stderr[-500:]}")
@@ -90,7 +107,7 @@ class RobustVideoAssembler:
                 # Try even simpler approach - just add narration to first clip
                 self.logger.info("Trying simplest approach...")
                 simple_cmd = [
-                    'ffmpeg',
+                    FFMPEG,
                     '-i', str(selected_clip),
                     '-i', str(audio_path),
                     '-c:v', 'copy',
@@ -100,10 +117,12 @@ class RobustVideoAssembler:
                     '-map', '0:v:0',
                     '-map', '1:a:0',
                     '-shortest',  # Stop at shortest stream
+                    '-progress', 'pipe:2',
+                    '-nostats',
                     str(output_path),
                     '-y'
                 ]
-                result = subprocess.run(simple_cmd, capture_output=True, text=True, timeout=60)
+                result = await run_ffmpeg(simple_cmd, timeout=60)
                 
                 if result.returncode != 0:
                     raise Exception("All assembly methods failed")
@@ -111,7 +130,7 @@ class RobustVideoAssembler:
             # Verify output
             if output_path.exists():
                 file_size_mb = output_path.stat().st_size / (1024 * 1024)
-                actual_duration = self._get_duration(output_path)
+                actual_duration = parse_progress_duration(result.stderr) or audio_duration
                 
                 self.logger.info(f"Video created: {output_path}")
                 self.logger.info(f"Size: {file_size_mb:.1f} MB, Duration: {actual_duration:.1f}s")
@@ -133,19 +152,19 @@ class RobustVideoAssembler:
             self.logger.error(f"Robust assembly failed: {e}")
             # Last resort: create simple video from thumbnail
             if thumbnail_path and thumbnail_path.exists():
-                return self._create_from_image(thumbnail_path, audio_path, output_path)
+                return await self._create_from_image(thumbnail_path, audio_path, output_path)
             else:
                 # Create placeholder
                 output_path.touch()
                 return output_path, {"error": str(e)}
     
-    def _create_from_image(self, image_path: Path, audio_path: Path, output_path: Path) -> Tuple[Path, Dict[str, Any]]:
+    async def _create_from_image(self, image_path: Path, audio_path: Path, output_path: Path) -> Tuple[Path, Dict[str, Any]]:
         """Create video from static image + audio"""
         try:
             audio_duration = self._get_duration(audio_path)
             
             cmd = [
-                'ffmpeg',
+                FFMPEG,
                 '-loop', '1',
                 '-i', str(image_path),
                 '-i', str(audio_path),
@@ -163,7 +182,7 @@ class RobustVideoAssembler:
             ]
             
             self.logger.info("Creating video from image...")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = await run_ffmpeg(cmd, timeout=120)
             
             if result.returncode == 0 and output_path.exists():
                 file_size_mb = output_path.stat().st_size / (1024 * 1024)
@@ -180,17 +199,10 @@ class RobustVideoAssembler:
         output_path.touch()
         return output_path, {"error": "All methods failed"}
     
+    def _probe_json(self, media_path: Path) -> Dict[str, Any]:
+        """Get cached ffprobe metadata for a media file"""
+        return get_probe_cache().get_probe(media_path)
+    
     def _get_duration(self, media_path: Path) -> float:
         """Get media duration"""
-        try:
-            probe_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                str(media_path)
-            ]
-            result = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=5)
-            return float(result.stdout.strip() or '60')
-        except:
-            return 60.0  # Default 1 minute
\ No newline at end of file
+        return self._probe_json(media_path).get('duration') or 60.0  # Default 1 minute
\ No newline at end of file
@@ -1,132 +1,89 @@
 """Ultra-simple video assembly - just audio with static image"""
 
+import asyncio
+import hashlib
+import math
+import os
 import subprocess
-from typing import Dict, Any, Optional, Tuple
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
+from ..utils.ffmpeg_utils import FFMPEG, HW_H264_ENCODERS, detect_h264_encoder, run_ffmpeg
+from ..utils.media_header import read_duration
+from ..utils.probe_cache import get_probe_cache
 
 
 class SimpleVideoAssembler:
     """Create simple videos using ffmpeg directly"""
     
+    SEED_SECONDS = 10  # Length of the pre-encoded still image clip
+    
     def __init__(self, dry_run: bool = False):
         """Initialize simple assembler."""
         self.config = get_config()
         self.logger = get_logger(__name__)
         self.dry_run = dry_run
         
+        # Encoder settings for static image video
+        self.preset = self.config.get('video.x264_preset', 'veryfast')
+        self.crf = self.config.get('video.x264_crf', 28)
+        
+        # Fragmented MP4 puts metadata up front without faststart's rewrite pass
+        if self.config.get('video.fragmented_mp4', True):
+            self.movflags = '+frag_keyframe+empty_moov+default_base_moof'
+        else:
+            self.movflags = '+faststart'
+        
+        # Prefer a hardware encoder when one is available
+        encoder = self.config.get('video.h264_encoder', 'auto')
+        if encoder == 'auto':
+            encoder = detect_h264_encoder()
+        elif encoder not in HW_H264_ENCODERS:
+            encoder = 'libx264'
+        self._video_codec = encoder
+        self.logger.info(f"Static image encoder: {self._video_codec}")
+        
     def assemble_video(self,
                       audio_path: Path,
                       clips_dir: Path, 
                       output_dir: Path,
                       script: Optional[Dict[str, Any]] = None,
                       thumbnail_path: Optional[Path] = None) -> Tuple[Path, Dict[str, Any]]:
+        """Synchronous wrapper around assemble_video_async."""
+        return asyncio.run(self.assemble_video_async(
+            audio_path, clips_dir, output_dir, script, thumbnail_path
+        ))
+    
+    async def assemble_video_async(self,
+                                   audio_path: Path,
+                                   clips_dir: Path, 
+                                   output_dir: Path,
+                                   script: Optional[Dict[str, Any]] = None,
+                                   thumbnail_path: Optional[Path] = None) -> Tuple[Path, Dict[str, Any]]:
         """Create video using ffmpeg with static image + audio."""
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        post_id = script.get('post_id', 'unknown') if script else 'unknown'
-        output_filename = f"video_{post_id}_{timestamp}.mp4"
-        output_path = output_dir / output_filename
+        output_path = self._output_path(output_dir, script)
         
         if self.dry_run:
             output_path.touch()
             return output_path, {"duration_seconds": 5.0, "method": "mock"}
             
         try:
-            # Use thumbnail or first clip frame as static image
-            image_path = thumbnail_path
-            
-            if not image_path or not image_path.exists():
-                # Try to extract frame from first video clip
-                clips = list(clips_dir.glob('*.mp4'))
-                if clips:
-                    image_path = output_dir / 'frame.jpg'
-                    extract_cmd = [
-                        'ffmpeg', '-i', str(clips[0]),
-                        '-vframes', '1',  # Extract 1 frame
-                        '-q:v', '2',  # Quality
-                        str(image_path),
-                        '-y'
-                    ]
-                    subprocess.run(extract_cmd, capture_output=True, timeout=5)
-                    
-            if not image_path or not image_path.exists():
-                # Create a simple black image
-                self.logger.warning("No image available, creating black video")
-                image_path = output_dir / 'black.jpg'
-                create_black = [
-                    'ffmpeg',
-                    '-f', 'lavfi',
-                    '-i', 'color=c=black:s=1280x720:d=1',
-                    '-frames:v', '1',
-                    str(image_path),
-                    '-y'
-                ]
-                subprocess.run(create_black, capture_output=True, timeout=5)
-            
-            # Get audio duration
-            probe_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                str(audio_path)
-            ]
-            result = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=5)
-            audio_duration = float(result.stdout.strip() or '60')
+            seed_path, audio_duration = await self._prepare(audio_path, clips_dir, thumbnail_path)
             
             # Create video with static image + audio using ffmpeg directly
             self.logger.info(f"Creating video with ffmpeg (duration: {audio_duration:.1f}s)...")
-            
-            ffmpeg_cmd = [
-                'ffmpeg',
-                '-loop', '1',  # Loop the image
-                '-i', str(image_path),  # Input image
-                '-i', str(audio_path),  # Input audio
-                '-c:v', 'libx264',  # Video codec
-                '-preset', 'ultrafast',  # Fastest encoding
-                '-crf', '28',  # Lower quality for speed
-                '-tune', 'stillimage',  # Optimize for still image
-                '-c:a', 'aac',  # Audio codec
-                '-b:a', '128k',  # Audio bitrate
-                '-pix_fmt', 'yuv420p',  # Pixel format for compatibility
-                '-t', str(audio_duration),  # Duration
-                '-movflags', '+faststart',  # Web optimization
-                str(output_path),
-                '-y'  # Overwrite
-            ]
-            
-            self.logger.info(f"Running: {' '.join(ffmpeg_cmd[:6])}...")
-            result = subprocess.run(
-                ffmpeg_cmd,
-                capture_output=True,
-                text=True,
-                timeout=60  # Should complete within 1 minute for static image
-            )
+            result = await self._mux_with_audio(seed_path, audio_path, audio_duration, output_path)
             
             if result.returncode != 0:
                 self.logger.error(f"FFmpeg error: {result.stderr[-500:]}")
                 raise Exception(f"FFmpeg failed: {result.returncode}")
             
-            # Verify output exists
-            if output_path.exists():
-                file_size_mb = output_path.stat().st_size / (1024 * 1024)
-                self.logger.info(f"Video created: {output_path} ({file_size_mb:.1f} MB)")
-                
-                metadata = {
-                    "video_file": output_path.name,
-                    "duration_seconds": audio_duration,
-                    "file_size_mb": file_size_mb,
-                    "method": "simple_ffmpeg",
-                    "encoding": "ultrafast"
-                }
-                
-                return output_path, metadata
-            else:
-                raise Exception("Output file not created")
+            return self._finish(output_path, audio_duration)
                 
         except subprocess.TimeoutExpired:
             self.logger.error("FFmpeg timed out")
@@ -137,4 +94,266 @@ class SimpleVideoAssembler:
             self.logger.error(f"Simple assembly failed: {e}")
             # Create placeholder
             output_path.touch()
-            return output_path, {"error": str(e), "method": "simple_ffmpeg"}
\ No newline at end of file
+            return output_path, {"error": str(e), "method": "simple_ffmpeg"}
+    
+    def assemble_videos(self, jobs: List[Dict[str, Any]]) -> List[Tuple[Path, Dict[str, Any]]]:
+        """Synchronous wrapper around assemble_videos_async."""
+        return asyncio.run(self.assemble_videos_async(jobs))
+    
+    async def assemble_videos_async(self, jobs: List[Dict[str, Any]]) -> List[Tuple[Path, Dict[str, Any]]]:
+        """Create several videos, muxing all of them in a single ffmpeg process.
+        
+        Seeds are prepared concurrently, then one ffmpeg invocation writes every
+        output so process startup is paid once per batch instead of per video.
+        If the batched run fails, each video is muxed on its own.
+        
+        Args:
+            jobs: Dictionaries with the keyword arguments of assemble_video
+            
+        Returns:
+            List of (video_path, metadata) in job order
+        """
+        if self.dry_run or len(jobs) < 2:
+            return [await self.assemble_video_async(**job) for job in jobs]
+        
+        output_paths = [self._output_path(job['output_dir'], job.get('script')) for job in jobs]
+        prepared = await asyncio.gather(*[
+            self._prepare(job['audio_path'], job['clips_dir'], job.get('thumbnail_path'))
+            for job in jobs
+        ], return_exceptions=True)
+        
+        results: List[Optional[Tuple[Path, Dict[str, Any]]]] = [None] * len(jobs)
+        mux_jobs = []
+        for i, (job, output_path, prep) in enumerate(zip(jobs, output_paths, prepared)):
+            if isinstance(prep, Exception):
+                self.logger.error(f"Simple assembly failed: {prep}")
+                output_path.touch()
+                results[i] = (output_path, {"error": str(prep), "method": "simple_ffmpeg"})
+            else:
+                seed_path, audio_duration = prep
+                mux_jobs.append((i, seed_path, job['audio_path'], audio_duration, output_path))
+        
+        if mux_jobs:
+            self.logger.info(f"Muxing {len(mux_jobs)} videos in one ffmpeg process...")
+            try:
+                result = await self._mux_many([job[1:] for job in mux_jobs])
+                batch_ok = result.returncode == 0
+                if not batch_ok:
+                    self.logger.warning(f"Batched mux failed, muxing videos one by one: {result.stderr[-500:]}")
+            except subprocess.TimeoutExpired:
+                self.logger.warning("Batched mux timed out, muxing videos one by one")
+                batch_ok = False
+            
+            for i, seed_path, audio_path, audio_duration, output_path in mux_jobs:
+                try:
+                    if not batch_ok:
+                        result = await self._mux_with_audio(seed_path, audio_path, audio_duration, output_path)
+                        if result.returncode != 0:
+                            self.logger.error(f"FFmpeg error: {result.stderr[-500:]}")
+                            raise Exception(f"FFmpeg failed: {result.returncode}")
+                    results[i] = self._finish(output_path, audio_duration)
+                except subprocess.TimeoutExpired:
+                    self.logger.error("FFmpeg timed out")
+                    output_path.touch()
+                    results[i] = (output_path, {"error": "timeout", "method": "simple_ffmpeg"})
+                except Exception as e:
+                    self.logger.error(f"Simple assembly failed: {e}")
+                    output_path.touch()
+                    results[i] = (output_path, {"error": str(e), "method": "simple_ffmpeg"})
+        
+        return results
+    
+    def _output_path(self, output_dir: Path, script: Optional[Dict[str, Any]]) -> Path:
+        """Build the output video path for a script"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        post_id = script.get('post_id', 'unknown') if script else 'unknown'
+        return output_dir / f"video_{post_id}_{timestamp}.mp4"
+    
+    async def _prepare(self,
+                       audio_path: Path,
+                       clips_dir: Path,
+                       thumbnail_path: Optional[Path]) -> Tuple[Path, float]:
+        """Pick the still image, encode its seed clip and get the audio duration.
+        
+        Returns:
+            Tuple of (seed clip path, audio duration in seconds)
+        """
+        # Probe audio duration in a worker thread while the frame is extracted
+        duration_task = asyncio.create_task(asyncio.to_thread(self._get_duration, audio_path))
+        
+        # Use thumbnail or first clip frame as static image
+        if thumbnail_path and thumbnail_path.exists():
+            image_path = thumbnail_path
+        else:
+            image_path = await self._get_fallback_image(clips_dir)
+        
+        # Get audio duration
+        audio_duration = await duration_task
+        
+        # Encode the image once as a short seed clip, then loop it with stream copy
+        seed_path = await self._encode_seed(image_path)
+        return seed_path, audio_duration
+    
+    async def _get_fallback_image(self, clips_dir: Path) -> Path:
+        """Get a frame from the first clip, or a black image if there is none.
+        
+        Images are cached, frames keyed by a hash of the clip's first 64 KB,
+        so repeat runs don't spawn ffmpeg again.
+        """
+        frame_dir = Path(self.config.get_paths()['cache_dir']) / 'frames'
+        frame_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Try to extract frame from first video clip
+        clip = next(clips_dir.glob('*.mp4'), None)
+        if clip:
+            with open(clip, 'rb') as f:
+                key = hashlib.sha256(f.read(65536)).hexdigest()[:16]
+            image_path = frame_dir / f"frame_{key}.jpg"
+            if image_path.exists():
+                return image_path
+            extract_cmd = [
+                FFMPEG, '-i', str(clip),
+                '-vframes', '1',  # Extract 1 frame
+                '-q:v', '2',  # Quality
+            ]
+            if await self._write_image(extract_cmd, image_path):
+                return image_path
+        
+        # Create a simple black image
+        self.logger.warning("No image available, creating black video")
+        image_path = frame_dir / 'black.jpg'
+        if not image_path.exists():
+            create_black = [
+                FFMPEG,
+                '-f', 'lavfi',
+                '-i', 'color=c=black:s=1280x720:d=1',
+                '-frames:v', '1',
+            ]
+            await self._write_image(create_black, image_path)
+        return image_path
+    
+    async def _write_image(self, cmd: List[str], image_path: Path) -> bool:
+        """Run an image-producing ffmpeg command, then move its output into place atomically"""
+        tmp_path = image_path.with_name(f"{image_path.stem}.{uuid.uuid4().hex}.jpg")
+        try:
+            await run_ffmpeg([*cmd, str(tmp_path), '-y'], timeout=5)
+            if not tmp_path.exists():
+                return False
+            os.replace(tmp_path, image_path)
+            return True
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
+    def _finish(self, output_path: Path, audio_duration: float) -> Tuple[Path, Dict[str, Any]]:
+        """Verify the muxed output and build its metadata"""
+        if not output_path.exists():
+            raise Exception("Output file not created")
+        
+        file_size_mb = output_path.stat().st_size / (1024 * 1024)
+        self.logger.info(f"Video created: {output_path} ({file_size_mb:.1f} MB)")
+        
+        metadata = {
+            "video_file": output_path.name,
+            "duration_seconds": audio_duration,
+            "file_size_mb": file_size_mb,
+            "method": "simple_ffmpeg",
+            "encoding": self.preset,
+            "video_codec": self._video_codec
+        }
+        
+        return output_path, metadata
+    
+    async def _encode_seed(self, image_path: Path) -> Path:
+        """Encode a still image into a short single-GOP clip, cached by image hash"""
+        settings = f"{self.SEED_SECONDS}:{self._video_codec}:{self.preset}:{self.crf}".encode()
+        digest = hashlib.md5(image_path.read_bytes() + settings).hexdigest()
+        seed_dir = Path(self.config.get_paths()['cache_dir']) / 'seeds'
+        seed_dir.mkdir(parents=True, exist_ok=True)
+        seed_path = seed_dir / f"seed_{digest}.mp4"
+        
+        if seed_path.exists():
+            return seed_path
+        
+        tmp_path = seed_path.with_name(f"{seed_path.stem}.{uuid.uuid4().hex}.mp4")
+        frames = self.SEED_SECONDS * 2
+        seed_cmd = [
+            FFMPEG,
+            '-loop', '1',  # Loop the image
+            '-i', str(image_path),  # Input image
+            '-t', str(self.SEED_SECONDS),
+            '-r', '2',  # Static image needs few frames
+            *self._encoder_args(),
+            '-g', str(frames),  # One keyframe per seed so loops join cleanly
+            '-keyint_min', str(frames),
+            '-sc_threshold', '0',
+            str(tmp_path),
+            '-y'
+        ]
+        try:
+            result = await run_ffmpeg(seed_cmd, timeout=30)
+            if result.returncode != 0:
+                self.logger.error(f"FFmpeg error: {result.stderr[-500:]}")
+                raise Exception(f"Seed encode failed: {result.returncode}")
+            # Batched jobs may encode the same seed concurrently
+            os.replace(tmp_path, seed_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return seed_path
+    
+    def _encoder_args(self) -> List[str]:
+        """Codec, rate control and pixel format flags for the selected encoder"""
+        quality = str(self.crf)
+        if self._video_codec == 'h264_nvenc':
+            return ['-c:v', 'h264_nvenc', '-preset', 'p4',
+                    '-rc', 'vbr', '-cq', quality, '-b:v', '0', '-maxrate', '2M',
+                    '-pix_fmt', 'yuv420p']
+        if self._video_codec == 'h264_qsv':
+            return ['-c:v', 'h264_qsv', '-preset', 'veryfast',
+                    '-global_quality', quality, '-pix_fmt', 'nv12']
+        if self._video_codec == 'h264_videotoolbox':
+            # VideoToolbox has no constant-quality mode on every Mac
+            return ['-c:v', 'h264_videotoolbox', '-b:v', '2M', '-pix_fmt', 'yuv420p']
+        return ['-c:v', 'libx264', '-preset', self.preset,
+                '-crf', quality, '-pix_fmt', 'yuv420p']  # Pixel format for compatibility
+    
+    async def _mux_with_audio(self, seed_path: Path, audio_path: Path, duration: float, output_path: Path):
+        """Loop the seed clip without re-encoding and add the audio track"""
+        return await self._mux_many([(seed_path, audio_path, duration, output_path)])
+    
+    async def _mux_many(self, jobs: List[Tuple[Path, Path, float, Path]]):
+        """Mux (seed, audio, duration, output) jobs with one ffmpeg process"""
+        ffmpeg_cmd = [FFMPEG, '-y']  # Overwrite
+        for seed_path, audio_path, duration, _ in jobs:
+            loops = max(1, math.ceil(duration / self.SEED_SECONDS))
+            ffmpeg_cmd += [
+                '-stream_loop', str(loops - 1),
+                '-i', str(seed_path),
+                '-i', str(audio_path),  # Input audio
+            ]
+        for i, (_, _, duration, output_path) in enumerate(jobs):
+            ffmpeg_cmd += [
+                '-map', f'{2 * i}:v:0',
+                '-map', f'{2 * i + 1}:a:0',
+                '-c:v', 'copy',  # Seed is already encoded
+                '-c:a', 'aac',  # Audio codec
+                '-b:a', '128k',  # Audio bitrate
+                '-t', str(duration),  # Duration
+                '-movflags', self.movflags,  # Web optimization
+                str(output_path)
+            ]
+        
+        self.logger.info(f"Running: {' '.join(ffmpeg_cmd[:6])}...")
+        return await run_ffmpeg(
+            ffmpeg_cmd,
+            timeout=60 * len(jobs)  # Stream copy, should complete well within a minute per video
+        )
+    
+    def _probe_json(self, media_path: Path) -> Dict[str, Any]:
+        """Get cached ffprobe metadata for a media file"""
+        return get_probe_cache().get_probe(media_path)
+    
+    def _get_duration(self, media_path: Path) -> float:
+        """Get media duration, reading the container header before trying ffprobe"""
+        return (read_duration(media_path)
+                or self._probe_json(media_path).get('duration')
+                or 60.0)
\ No newline at end of file
@@ -2,13 +2,84 @@
 
 import re
 import json
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-from collections import Counter
+from collections import Counter, OrderedDict
+
+import numpy as np
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
+try:
+    import ahocorasick
+except ImportError:  # Optional - fall back to compiled regex scanning
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # Optional - fall back to the backtracking re engine
+    re2 = None
+
+
+# Keyword matches in the title count this many times
+TITLE_WEIGHT = 3
+
+# Maximum number of posts with memoized extracted text
+TEXT_CACHE_SIZE = 1024
+
+# Subreddit to topic mapping
+SUBREDDIT_MAPPINGS = {
+    'ai_news': ['artificialintelligence', 'machinelearning', 'openai', 'singularity', 'technology'],
+    'listicle': ['todayilearned', 'interestingasfuck', 'mildlyinteresting', 'dataisbeautiful', 'coolguides'],
+    'explainer': ['explainlikeimfive', 'askscience', 'askreddit', 'nostupidquestions', 'outoftheloop']
+}
+
+# Topic-specific script configurations
+TOPIC_CONFIGS = MappingProxyType({
+    'ai_news': MappingProxyType({
+        'tone': 'crisp',
+        'style': 'current, lightly analytical',
+        'hook_style': 'news_bulletin',
+        'chapter_count': 5,
+        'visual_style': 'tech_focused'
+    }),
+    'listicle': MappingProxyType({
+        'tone': 'energetic',
+        'style': 'curiosity-driven, punchy',
+        'hook_style': 'countdown',
+        'chapter_count': 10,
+        'visual_style': 'dynamic'
+    }),
+    'explainer': MappingProxyType({
+        'tone': 'patient',
+        'style': 'teacher, plain language',
+        'hook_style': 'question',
+        'chapter_count': 5,
+        'visual_style': 'educational'
+    })
+})
+
+
+def _compile_keyword_pattern(pattern: bytes):
+    """Compile a case-insensitive keyword alternation, preferring linear-time RE2.
+    
+    Args:
+        pattern: Bytes regex of escaped keyword alternatives
+        
+    Returns:
+        Compiled pattern supporting finditer and match.lastindex
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
 
 class TopicClassifier:
     """Classifies Reddit posts into predefined topics."""
@@ -23,20 +94,125 @@ class TopicClassifier:
         self.default_topic = self.topics_config.get('default', 'explainer')
         self.rules = self.topics_config.get('rules', {})
         
+        # Content policy terms, read once rather than per post
+        self._banned_terms = tuple(self.config.get('content_policy.banned_terms', []))
+        self._sensitive_topics = tuple(self.config.get('content_policy.sensitive_topics', []))
+        
+        # Topic configs merged with the base template once
+        self._default_topic_config = {
+            'target_minutes': self.config.get('video.target_minutes', 10),
+            'tone': 'neutral',
+            'style': 'informative'
+        }
+        self._topic_configs_merged = {
+            topic: {**self._default_topic_config, **config}
+            for topic, config in TOPIC_CONFIGS.items()
+        }
+        
         # Compile regex patterns for efficiency
         self._compile_patterns()
         
+        # Extracted text per post, keyed by the fields it is built from
+        self._text_cache: "OrderedDict[Tuple, Tuple[str, int, bytes, int]]" = OrderedDict()
+        
     def _compile_patterns(self):
         """Compile regex patterns for topic keywords."""
         self.topic_patterns = {}
+        self.topic_groups = {}
         
         for topic, config in self.rules.items():
             keywords = config.get('keywords', [])
             if keywords:
-                # Create regex pattern from keywords
-                pattern = '|'.join([re.escape(kw.lower()) for kw in keywords])
-                self.topic_patterns[topic] = re.compile(pattern, re.IGNORECASE)
+                # One group per keyword, so match.lastindex identifies it.
+                # Patterns scan UTF-8 bytes, which stay compact for emoji-heavy posts
+                pattern = b'|'.join([b'(%s)' % re.escape(kw.lower().encode()) for kw in keywords])
+                self.topic_patterns[topic] = _compile_keyword_pattern(pattern)
+                self.topic_groups[topic] = tuple(kw.lower() for kw in keywords)
                 
+        # Lowercased UTF-8 policy terms for substring checks on the regex path
+        self._policy_terms_b = {
+            'banned': tuple((term, term.lower().encode()) for term in self._banned_terms),
+            'sensitive': tuple((term, term.lower().encode()) for term in self._sensitive_topics)
+        }
+        
+        self._automaton = self._build_automaton() if ahocorasick else None
+        
+    def _build_automaton(self):
+        """Build one Aho-Corasick automaton over every keyword the classifier scans for.
+        
+        Topic keywords, banned terms and sensitive topics share the automaton,
+        so a single pass over the text finds them all. Each word maps to a
+        list of (category, key, keyword, order) entries, where order is the
+        keyword's position in its topic's alternation.
+        """
+        entries: Dict[str, List[Tuple[str, str, str, int]]] = {}
+        
+        def add(word: str, category: str, key: str, order: int = 0):
+            entries.setdefault(word.lower(), []).append((category, key, word.lower(), order))
+            
+        for topic, config in self.rules.items():
+            for order, kw in enumerate(config.get('keywords', [])):
+                add(kw, 'topic', topic, order)
+        for term in self._banned_terms:
+            add(term, 'banned', term)
+        for term in self._sensitive_topics:
+            add(term, 'sensitive', term)
+            
+        automaton = ahocorasick.Automaton()
+        for word, values in entries.items():
+            automaton.add_word(word, values)
+        automaton.make_automaton()
+        return automaton
+        
+    def _scan_post(self, post: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Find all keyword, banned-term and sensitive-topic matches in a post.
+        
+        Topic keywords found within the title count three times.
+        
+        Args:
+            post: Reddit post dictionary
+            
+        Returns:
+            Mapping of 'topic' to {topic: Counter of keyword matches} and of
+            'banned' / 'sensitive' to {term: [matched terms]}
+        """
+        hits: Dict[str, Dict[str, Any]] = {'topic': {}, 'banned': {}, 'sensitive': {}}
+        
+        if self._automaton is not None:
+            text, title_len = self._extract_text_parts(post)
+            spans: Dict[str, List[Tuple[int, int, int, str]]] = {}
+            for end, values in self._automaton.iter(text):
+                for category, key, kw, order in values:
+                    if category == 'topic':
+                        spans.setdefault(key, []).append((end - len(kw) + 1, order, end, kw))
+                    elif category in hits:
+                        hits[category].setdefault(key, []).append(kw)
+                        
+            # Keep leftmost, first-alternative, non-overlapping matches like re.findall
+            for topic in self.topic_patterns:
+                last_end = -1
+                for start, _, end, kw in sorted(spans.get(topic, [])):
+                    if start > last_end:
+                        weight = TITLE_WEIGHT if end < title_len else 1
+                        hits['topic'].setdefault(topic, Counter())[kw] += weight
+                        last_end = end
+            return hits
+            
+        text, title_len = self._extract_bytes_parts(post)
+        for topic, pattern in self.topic_patterns.items():
+            groups = self.topic_groups[topic]
+            found_keywords = Counter()
+            for m in pattern.finditer(text):
+                weight = TITLE_WEIGHT if m.end() <= title_len else 1
+                found_keywords[groups[m.lastindex - 1]] += weight
+            if found_keywords:
+                hits['topic'][topic] = found_keywords
+        for category, terms in self._policy_terms_b.items():
+            for term, term_b in terms:
+                if term_b in text:
+                    hits[category][term] = [term.lower()]
+        return hits
+        
     def classify(self, post: Dict[str, Any]) -> Tuple[str, float, Dict[str, Any]]:
         """Classify a Reddit post into a topic.
         
@@ -46,12 +222,97 @@ class TopicClassifier:
         Returns:
             Tuple of (topic_id, confidence_score, metadata)
         """
-        # Extract text for analysis
-        text = self._extract_text(post)
-        
         # Try rule-based classification first
-        topic, confidence, metadata = self._rule_based_classification(text, post)
+        topic, confidence, metadata = self._rule_based_classification(post)
+        
+        return self._resolve_classification(post, topic, confidence, metadata)
+        
+    def classify_batch(self, posts: List[Dict[str, Any]]) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """Classify many posts with one regex pass per topic.
+        
+        All post texts are joined into one buffer; each topic pattern scans
+        it once and matches are attributed back to posts by offset.
+        
+        Args:
+            posts: Reddit post dictionaries
+            
+        Returns:
+            List of (topic_id, confidence_score, metadata) in input order
+        """
+        if not posts:
+            return []
+            
+        parts = [self._extract_bytes_parts(post) for post in posts]
+        texts = [text for text, _ in parts]
+        joined = b'\x1e'.join(texts)
+        boundaries = np.cumsum([len(text) + 1 for text in texts])
+        starts = boundaries - np.array([len(text) + 1 for text in texts])
+        title_lens = np.array([title_len for _, title_len in parts], dtype=np.int64)
+        
+        topics = list(self.topic_patterns)
+        counts = np.zeros((len(topics), len(posts)), dtype=np.int64)
+        unique_counts = np.zeros((len(topics), len(posts)), dtype=np.int64)
+        keywords: List[Dict[int, set]] = []
+        
+        for i, topic in enumerate(topics):
+            groups = self.topic_groups[topic]
+            found = [(m.end(), groups[m.lastindex - 1]) for m in self.topic_patterns[topic].finditer(joined)]
+            ends = np.fromiter((end for end, _ in found), dtype=np.int64, count=len(found))
+            post_idx = np.searchsorted(boundaries, ends - 1, side='right')
+            # Matches inside the title count three times
+            weights = np.where(ends - starts[post_idx] <= title_lens[post_idx], TITLE_WEIGHT, 1)
+            counts[i] = np.bincount(post_idx, weights=weights, minlength=len(posts)).astype(np.int64)
+            
+            per_post: Dict[int, set] = {}
+            for idx, (_, kw) in zip(post_idx.tolist(), found):
+                per_post.setdefault(idx, set()).add(kw)
+            for idx, kws in per_post.items():
+                unique_counts[i, idx] = len(kws)
+            keywords.append(per_post)
+            
+        # Score based on frequency and uniqueness
+        scores = counts * 0.7 + unique_counts * 0.3
+        best = scores.argmax(axis=0) if topics else np.zeros(len(posts), dtype=np.int64)
+        
+        results = []
+        for j, post in enumerate(posts):
+            if not topics or counts[:, j].sum() == 0:
+                topic, confidence, metadata = self.default_topic, 0.3, {
+                    'classification_method': 'rule_based',
+                    'reason': 'No keyword matches'
+                }
+            else:
+                b = int(best[j])
+                topic = topics[b]
+                confidence = min(float(scores[b, j]) / 20, 1.0)
+                metadata = {
+                    'classification_method': 'rule_based',
+                    'match_details': {
+                        'keywords_found': list(keywords[b][j]),
+                        'match_count': int(counts[b, j])
+                    },
+                    'all_scores': {t: float(scores[i, j]) for i, t in enumerate(topics) if counts[i, j]}
+                }
+            results.append(self._resolve_classification(post, topic, confidence, metadata))
+            
+        return results
+        
+    def _resolve_classification(self,
+                                post: Dict[str, Any],
+                                topic: str,
+                                confidence: float,
+                                metadata: Dict[str, Any]) -> Tuple[str, float, Dict[str, Any]]:
+        """Apply subreddit and default fallbacks to a rule-based result.
         
+        Args:
+            post: Reddit post dictionary
+            topic: Rule-based topic
+            confidence: Rule-based confidence
+            metadata: Rule-based metadata
+            
+        Returns:
+            Tuple of (topic_id, confidence_score, metadata)
+        """
         if confidence > 0.7:
             self.logger.info(f"Classified as '{topic}' with confidence {confidence:.2f}")
             return topic, confidence, metadata
@@ -82,31 +343,82 @@ class TopicClassifier:
         Returns:
             Combined text for analysis
         """
+        return self._extract_text_parts(post)[0]
+        
+    def _extract_text_parts(self, post: Dict[str, Any]) -> Tuple[str, int]:
+        """Extract lowercased searchable text and the length of its leading title.
+        
+        Args:
+            post: Reddit post dictionary
+            
+        Returns:
+            Tuple of (combined text, title length)
+        """
+        return self._extract_all(post)[:2]
+        
+    def _extract_bytes_parts(self, post: Dict[str, Any]) -> Tuple[bytes, int]:
+        """Extract lowercased searchable text as UTF-8 and its title length in bytes.
+        
+        Args:
+            post: Reddit post dictionary
+            
+        Returns:
+            Tuple of (combined UTF-8 text, title length in bytes)
+        """
+        return self._extract_all(post)[2:]
+        
+    def _extract_all(self, post: Dict[str, Any]) -> Tuple[str, int, bytes, int]:
+        """Build the str and UTF-8 forms of a post's searchable text.
+        
+        Results are memoized on the post's text fields, so classify and
+        analyze_post_suitability share one extraction per post.
+        
+        Args:
+            post: Reddit post dictionary
+            
+        Returns:
+            Tuple of (text, title length, UTF-8 text, title length in bytes)
+        """
+        key = (post.get('title'), post.get('selftext'), post.get('subreddit'), post.get('flair'))
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+            return cached
+            
         parts = []
+        title_len = 0
+        title_bytes_len = 0
         
-        # Title (most important)
+        # Title (most important, matches are weighted at scoring time)
         if post.get('title'):
-            parts.append(post['title'] * 3)  # Weight title more
+            title = post['title'].lower()
+            title_len = len(title)
+            title_bytes_len = len(title.encode())
+            parts.append(title)
             
         # Self text
         if post.get('selftext'):
-            parts.append(post['selftext'])
+            parts.append(post['selftext'].lower())
             
         # Subreddit
         if post.get('subreddit'):
-            parts.append(f"subreddit: {post['subreddit']}")
+            parts.append(f"subreddit: {post['subreddit']}".lower())
             
         # Flair
         if post.get('flair'):
-            parts.append(f"flair: {post['flair']}")
+            parts.append(f"flair: {post['flair']}".lower())
             
-        return ' '.join(parts).lower()
-        
-    def _rule_based_classification(self, text: str, post: Dict[str, Any]) -> Tuple[str, float, Dict[str, Any]]:
+        text = ' '.join(parts)
+        result = (text, title_len, text.encode(), title_bytes_len)
+        self._text_cache[key] = result
+        if len(self._text_cache) > TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return result
+        
+    def _rule_based_classification(self, post: Dict[str, Any]) -> Tuple[str, float, Dict[str, Any]]:
         """Classify using keyword rules.
         
         Args:
-            text: Text to analyze
             post: Original post data
             
         Returns:
@@ -115,13 +427,12 @@ class TopicClassifier:
         matches = {}
         match_details = {}
         
-        # Check each topic's patterns
-        for topic, pattern in self.topic_patterns.items():
-            found_keywords = pattern.findall(text)
+        # Check each topic's keyword matches
+        for topic, found_keywords in self._scan_post(post)['topic'].items():
             if found_keywords:
                 # Calculate match score
-                unique_keywords = set(kw.lower() for kw in found_keywords)
-                match_count = len(found_keywords)
+                unique_keywords = set(found_keywords)
+                match_count = sum(found_keywords.values())
                 unique_count = len(unique_keywords)
                 
                 # Score based on frequency and uniqueness
@@ -165,19 +476,11 @@ class TopicClassifier:
         """
         subreddit = post.get('subreddit', '').lower()
         
-        # Subreddit to topic mapping
-        subreddit_mappings = {
-            'ai_news': ['artificialintelligence', 'machinelearning', 'openai', 'singularity', 'technology'],
-            'listicle': ['todayilearned', 'interestingasfuck', 'mildlyinteresting', 'dataisbeautiful', 'coolguides'],
-            'explainer': ['explainlikeimfive', 'askscience', 'askreddit', 'nostupidquestions', 'outoftheloop']
-        }
-        
-        for topic, subreddits in subreddit_mappings.items():
+        for topic, subreddits in SUBREDDIT_MAPPINGS.items():
             if subreddit in subreddits:
                 return topic, 0.8
                 
-        # Check partial matches
-        for topic, subreddits in subreddit_mappings.items():
+        for topic, subreddits in SUBREDDIT_MAPPINGS.items():
             for sub in subreddits:
                 if sub in subreddit or subreddit in sub:
                     return topic, 0.6
@@ -193,42 +496,7 @@ class TopicClassifier:
         Returns:
             Topic configuration dictionary
         """
-        base_config = {
-            'topic_id': topic_id,
-            'target_minutes': self.config.get('video.target_minutes', 10),
-            'tone': 'neutral',
-            'style': 'informative'
-        }
-        
-        # Topic-specific configurations
-        topic_configs = {
-            'ai_news': {
-                'tone': 'crisp',
-                'style': 'current, lightly analytical',
-                'hook_style': 'news_bulletin',
-                'chapter_count': 5,
-                'visual_style': 'tech_focused'
-            },
-            'listicle': {
-                'tone': 'energetic',
-                'style': 'curiosity-driven, punchy',
-                'hook_style': 'countdown',
-                'chapter_count': 10,
-                'visual_style': 'dynamic'
-            },
-            'explainer': {
-                'tone': 'patient',
-                'style': 'teacher, plain language',
-                'hook_style': 'question',
-                'chapter_count': 5,
-                'visual_style': 'educational'
-            }
-        }
-        
-        if topic_id in topic_configs:
-            base_config.update(topic_configs[topic_id])
-            
-        return base_config
+        return {'topic_id': topic_id, **self._topic_configs_merged.get(topic_id, self._default_topic_config)}
         
     def analyze_post_suitability(self, post: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze if post is suitable for video creation.
@@ -260,18 +528,16 @@ class TopicClassifier:
                 score -= 30
                 
         # Check for problematic content
-        text = self._extract_text(post)
+        hits = self._scan_post(post)
         
         # Check for banned terms
-        banned_terms = self.config.get('content_policy.banned_terms', [])
-        found_banned = [term for term in banned_terms if term.lower() in text]
+        found_banned = [term for term in self._banned_terms if term in hits['banned']]
         if found_banned:
             issues.append(f"Contains banned terms: {', '.join(found_banned)}")
             score -= 50
             
         # Check for sensitive topics
-        sensitive_topics = self.config.get('content_policy.sensitive_topics', [])
-        found_sensitive = [topic for topic in sensitive_topics if topic.lower() in text]
+        found_sensitive = [topic for topic in self._sensitive_topics if topic in hits['sensitive']]
         if found_sensitive:
             warnings.append(f"Contains sensitive topics: {', '.join(found_sensitive)}")
             score -= 15
@@ -0,0 +1,117 @@
+"""Clip library normalization so clips can be concatenated with stream copy."""
+
+import os
+import subprocess
+import uuid
+from pathlib import Path
+from typing import List
+
+from ..utils.config import get_config
+from ..utils.ffmpeg_utils import FFMPEG
+from ..utils.logger import get_logger
+
+
+NORMALIZED_DIRNAME = '_normalized'
+
+logger = get_logger(__name__)
+
+
+def normalize_library(clips_dir: Path,
+                      width: int = 1920,
+                      height: int = 1080,
+                      fps: int = 30,
+                      container: str = 'mp4') -> List[Path]:
+    """Normalize every .mp4 clip in a directory.
+
+    Args:
+        clips_dir: Directory containing source .mp4 clips
+        width: Output width
+        height: Output height
+        fps: Output frame rate
+        container: Output container, 'mp4' or 'ts'
+
+    Returns:
+        Sorted list of normalized clip paths (source path if normalizing failed)
+    """
+    return normalize_clips(sorted(clips_dir.glob('*.mp4')), width, height, fps, container)
+
+
+def normalize_clips(clips: List[Path],
+                    width: int = 1920,
+                    height: int = 1080,
+                    fps: int = 30,
+                    container: str = 'mp4') -> List[Path]:
+    """Re-encode clips to one canonical profile, reusing up-to-date results.
+
+    Every normalized clip shares codec, resolution, frame rate and audio
+    layout, which is what the concat demuxer needs for ``-c copy``. With
+    ``container='ts'`` the clips are written as MPEG-TS, which can be
+    joined by plain byte concatenation. Clips are re-encoded only when the
+    normalized copy is missing or older than the source. The encoder preset
+    and CRF come from ``video.x264_preset`` and ``video.x264_crf``.
+
+    Args:
+        clips: Source clip paths
+        width: Output width
+        height: Output height
+        fps: Output frame rate
+        container: Output container, 'mp4' or 'ts'
+
+    Returns:
+        List of normalized clip paths (source path if normalizing failed)
+    """
+    config = get_config()
+    preset = config.get('video.x264_preset', 'veryfast')
+    crf = config.get('video.x264_crf', 28)
+
+    normalized = []
+    for clip in clips:
+        normalized_dir = clip.parent / NORMALIZED_DIRNAME
+        normalized_dir.mkdir(exist_ok=True)
+        # Source suffix in the name keeps a.mp4 and a.mov apart
+        target = normalized_dir / f"{clip.stem}_{clip.suffix.lstrip('.')}.{container}"
+        if target.exists() and target.stat().st_mtime >= clip.stat().st_mtime:
+            normalized.append(target)
+            continue
+
+        logger.info(f"Normalizing clip: {clip.name}")
+        cmd = [
+            FFMPEG, '-hide_banner', '-loglevel', 'error', '-nostats',
+            '-i', str(clip),
+            # Silent track so every clip has the same stream layout
+            '-f', 'lavfi', '-i', 'anullsrc=r=48000:cl=stereo',
+            '-map', '0:v:0',
+            '-map', '1:a:0',
+            '-vf', f'scale={width}:{height}:force_original_aspect_ratio=decrease,'
+                   f'pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps}',
+            '-c:v', 'libx264',
+            '-preset', preset,
+            '-crf', str(crf),
+            '-pix_fmt', 'yuv420p',
+            '-c:a', 'aac',
+            '-ar', '48000',
+            '-ac', '2',
+            '-shortest',
+        ]
+        if container == 'ts':
+            cmd += ['-bsf:v', 'h264_mp4toannexb', '-f', 'mpegts']
+        # Written under a temporary name so a killed run never leaves a
+        # truncated clip that looks up to date
+        tmp_path = target.with_name(f"{target.stem}.{uuid.uuid4().hex}.{container}")
+        cmd += [str(tmp_path), '-y']
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            if result.returncode == 0 and tmp_path.exists():
+                os.replace(tmp_path, target)
+                normalized.append(target)
+                continue
+        except subprocess.TimeoutExpired:
+            pass
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        logger.warning(f"Could not normalize {clip.name}, using original")
+        normalized.append(clip)
+
+    return normalized
@@ -1,17 +1,27 @@
 """Reddit content ingestion module."""
 
-import json
 import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Dict, List, Optional, Any, Set, TYPE_CHECKING
 from pathlib import Path
-import praw
-from praw.models import Submission
+import numpy as np
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
+from ..utils.json_io import dump_json
 from ..utils.dedup import DeduplicationManager
 
+if TYPE_CHECKING:
+    from praw.models import Submission
+
+
+REDDIT_URL = 'https://reddit.com'
+
+# Candidate pools at least this large are scored with NumPy
+VECTORIZED_SCORING_MIN_POSTS = 64
+
 
 class RedditIngestor:
     """Fetches and processes Reddit content."""
@@ -27,6 +37,12 @@ class RedditIngestor:
         self.dry_run = dry_run
         self.dedup = DeduplicationManager()
         
+        # Legacy post IDs were MD5s of the full post URL
+        self.check_legacy_ids = self.config.get('deduplication.check_legacy_ids', True)
+        
+        # Submissions from the last fetch, for filling in details of the chosen post
+        self._submissions: Dict[str, "Submission"] = {}
+        
         if not dry_run:
             self._init_reddit_client()
         else:
@@ -34,6 +50,9 @@ class RedditIngestor:
             
     def _init_reddit_client(self):
         """Initialize Reddit API client."""
+        # Imported here so dry runs don't pay for loading praw
+        import praw
+        
         api_keys = self.config.get_api_keys()
         
         self.reddit = praw.Reddit(
@@ -64,13 +83,13 @@ class RedditIngestor:
         subreddit_name = self.config.get('reddit.subreddit', 'popular')
         min_score = self.config.get('reddit.min_score', 1000)
         time_filter = self.config.get('reddit.time_filter', 'day')
-        excluded_subreddits = self.config.get('reddit.excluded_subreddits', [])
-        excluded_flairs = self.config.get('reddit.excluded_flairs', [])
+        excluded_subreddits = {s.lower() for s in self.config.get('reddit.excluded_subreddits', [])}
+        excluded_flairs = set(self.config.get('reddit.excluded_flairs', []))
         
         self.logger.info(f"Fetching posts from r/{subreddit_name}")
         
         subreddit = self.reddit.subreddit(subreddit_name)
-        posts = []
+        captured_at = datetime.now().isoformat()
         
         # Fetch posts based on time filter
         if time_filter == 'hour':
@@ -78,44 +97,72 @@ class RedditIngestor:
         else:
             submissions = subreddit.top(time_filter=time_filter, limit=limit * 3)
             
-        for submission in submissions:
-            # Apply filters
-            if submission.score < min_score:
-                continue
-                
-            if submission.subreddit.display_name.lower() in [s.lower() for s in excluded_subreddits]:
-                self.logger.debug(f"Skipping excluded subreddit: {submission.subreddit.display_name}")
-                continue
-                
-            if submission.link_flair_text and submission.link_flair_text in excluded_flairs:
-                self.logger.debug(f"Skipping excluded flair: {submission.link_flair_text}")
-                continue
-                
-            if submission.over_18:
-                self.logger.debug("Skipping NSFW post")
-                continue
-                
-            # Check deduplication
-            post_id = self._generate_post_id(submission.permalink)
-            if self.dedup.is_duplicate(post_id):
-                self.logger.debug(f"Skipping duplicate post: {submission.title}")
-                continue
-                
-            # Extract post data
-            post_data = self._extract_post_data(submission)
-            posts.append(post_data)
-            
-            if len(posts) >= limit:
-                break
-                
+        # Lazy pipeline: cheap listing filters, then dedup, stopping at the limit
+        eligible = (s for s in submissions
+                    if self._passes_filters(s, min_score, excluded_subreddits, excluded_flairs))
+        fresh = (s for s in eligible if not self._is_duplicate_submission(s))
+        selected = list(islice(fresh, limit))
+        self._submissions = {s.id: s for s in selected}
+        posts = [self._extract_post_data(s, captured_at) for s in selected]
+        
         self.logger.info(f"Fetched {len(posts)} posts")
         return posts
         
-    def _extract_post_data(self, submission: Submission) -> Dict[str, Any]:
-        """Extract relevant data from Reddit submission.
+    def _passes_filters(self, submission: "Submission", min_score: int,
+                        excluded_subreddits: Set[str], excluded_flairs: Set[str]) -> bool:
+        """Apply the score, subreddit, flair and NSFW filters to a submission.
+        
+        Args:
+            submission: PRAW submission object
+            min_score: Minimum post score
+            excluded_subreddits: Lowercased subreddit names to skip
+            excluded_flairs: Flair texts to skip
+            
+        Returns:
+            True if the submission should be considered
+        """
+        if submission.score < min_score:
+            return False
+            
+        subreddit_name = submission.subreddit.display_name
+        if subreddit_name.lower() in excluded_subreddits:
+            self.logger.debug(f"Skipping excluded subreddit: {subreddit_name}")
+            return False
+            
+        flair = submission.link_flair_text
+        if flair and flair in excluded_flairs:
+            self.logger.debug(f"Skipping excluded flair: {flair}")
+            return False
+            
+        if submission.over_18:
+            self.logger.debug("Skipping NSFW post")
+            return False
+            
+        return True
+        
+    def _is_duplicate_submission(self, submission: "Submission") -> bool:
+        """Check a submission against the dedup cache, logging skips.
+        
+        Args:
+            submission: PRAW submission object
+            
+        Returns:
+            True if the submission was already processed
+        """
+        if self._is_duplicate(submission.id, submission.permalink):
+            self.logger.debug(f"Skipping duplicate post: {submission.title}")
+            return True
+        return False
+        
+    def _extract_post_data(self, submission: "Submission", captured_at: Optional[str] = None) -> Dict[str, Any]:
+        """Extract the fields used for ranking and classification.
+        
+        Display-only fields are added by _add_post_details once a post is
+        chosen, so they are not read for every candidate.
         
         Args:
             submission: Reddit submission object
+            captured_at: ISO timestamp of the fetch (defaults to now)
             
         Returns:
             Dictionary of post data
@@ -124,30 +171,66 @@ class RedditIngestor:
             'id': submission.id,
             'title': submission.title,
             'selftext': submission.selftext[:5000] if submission.selftext else '',
-            'url': f"https://reddit.com{submission.permalink}",
+            'url': f"{REDDIT_URL}{submission.permalink}",
             'subreddit': submission.subreddit.display_name,
-            'author': str(submission.author) if submission.author else '[deleted]',
             'score': submission.score,
             'num_comments': submission.num_comments,
             'created_utc': submission.created_utc,
-            'captured_at': datetime.now().isoformat(),
+            'captured_at': captured_at or datetime.now().isoformat(),
             'flair': submission.link_flair_text,
-            'is_video': submission.is_video,
-            'is_self': submission.is_self,
-            'domain': submission.domain,
             'upvote_ratio': submission.upvote_ratio
         }
         
-    def _generate_post_id(self, permalink: str) -> str:
+    def _add_post_details(self, post: Dict[str, Any]) -> Dict[str, Any]:
+        """Add display-only fields to a chosen post.
+        
+        Args:
+            post: Post dictionary from fetch_trending_posts
+            
+        Returns:
+            The same post dictionary, updated in place
+        """
+        submission = self._submissions.get(post['id'])
+        if submission is None or 'author' in post:
+            return post
+            
+        post.update({
+            'author': str(submission.author) if submission.author else '[deleted]',
+            'is_video': submission.is_video,
+            'is_self': submission.is_self,
+            'domain': submission.domain
+        })
+        return post
+        
+    def _generate_post_id(self, reddit_id: str) -> str:
         """Generate unique ID for post.
         
+        Reddit's base36 submission ID is already unique, so no hashing is needed.
+        
+        Args:
+            reddit_id: Reddit submission ID (e.g. '1abc2d')
+            
+        Returns:
+            Fullname-style ID for deduplication
+        """
+        return f"t3_{reddit_id}"
+        
+    def _is_duplicate(self, reddit_id: str, permalink: str) -> bool:
+        """Check whether a post was already processed.
+        
         Args:
-            permalink: Reddit post permalink
+            reddit_id: Reddit submission ID
+            permalink: Reddit post permalink, used to match legacy hashed IDs
             
         Returns:
-            Hash ID for deduplication
+            True if the post ID, or its legacy hashed ID, is in the dedup cache
         """
-        return hashlib.md5(permalink.encode()).hexdigest()
+        if self.dedup.is_duplicate(self._generate_post_id(reddit_id)):
+            return True
+        if self.check_legacy_ids:
+            url = permalink if permalink.startswith(REDDIT_URL) else f"{REDDIT_URL}{permalink}"
+            return self.dedup.is_duplicate(hashlib.md5(url.encode()).hexdigest())
+        return False
         
     def _get_test_posts(self) -> List[Dict[str, Any]]:
         """Get test posts for dry run mode.
@@ -155,6 +238,7 @@ class RedditIngestor:
         Returns:
             List of test post dictionaries
         """
+        now = datetime.now()
         return [
             {
                 'id': 'test123',
@@ -165,8 +249,8 @@ class RedditIngestor:
                 'author': 'test_user',
                 'score': 15234,
                 'num_comments': 523,
-                'created_utc': datetime.now().timestamp(),
-                'captured_at': datetime.now().isoformat(),
+                'created_utc': now.timestamp(),
+                'captured_at': now.isoformat(),
                 'flair': 'Biology',
                 'is_video': False,
                 'is_self': True,
@@ -182,8 +266,8 @@ class RedditIngestor:
                 'author': 'tech_enthusiast',
                 'score': 8934,
                 'num_comments': 245,
-                'created_utc': datetime.now().timestamp(),
-                'captured_at': datetime.now().isoformat(),
+                'created_utc': now.timestamp(),
+                'captured_at': now.isoformat(),
                 'flair': 'Discussion',
                 'is_video': False,
                 'is_self': True,
@@ -204,29 +288,35 @@ class RedditIngestor:
         if not posts:
             return None
             
-        # Score posts based on multiple factors
-        scored_posts = []
-        for post in posts:
-            score = self._calculate_post_score(post)
-            scored_posts.append((score, post))
-            
-        # Sort by score (highest first)
-        scored_posts.sort(key=lambda x: x[0], reverse=True)
-        
-        best_post = scored_posts[0][1]
+        # Score posts based on multiple factors and keep the highest
+        now_ts = time.time()
+        if len(posts) >= VECTORIZED_SCORING_MIN_POSTS:
+            best_post = posts[int(self._score_posts_vectorized(posts, now_ts).argmax())]
+        else:
+            best_post = max(posts, key=lambda post: self._calculate_post_score(post, now_ts))
+        self._add_post_details(best_post)
         self.logger.info(f"Selected post: {best_post['title']}")
         
         # Mark as processed
-        post_id = self._generate_post_id(best_post['url'])
-        self.dedup.add_item(post_id)
+        self.mark_processed(best_post)
         
         return best_post
         
-    def _calculate_post_score(self, post: Dict[str, Any]) -> float:
+    def mark_processed(self, post: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None):
+        """Record a post in the dedup cache so it is not picked again.
+        
+        Args:
+            post: Post data
+            metadata: Optional metadata to store with the entry
+        """
+        self.dedup.add_item(self._generate_post_id(post['id']), metadata)
+        
+    def _calculate_post_score(self, post: Dict[str, Any], now_ts: Optional[float] = None) -> float:
         """Calculate quality score for a post.
         
         Args:
             post: Post dictionary
+            now_ts: Current Unix timestamp (defaults to now)
             
         Returns:
             Quality score
@@ -254,8 +344,9 @@ class RedditIngestor:
             score += 1.0
             
         # Recency bonus
-        created_time = datetime.fromtimestamp(post['created_utc'])
-        hours_old = (datetime.now() - created_time).total_seconds() / 3600
+        if now_ts is None:
+            now_ts = time.time()
+        hours_old = (now_ts - post['created_utc']) / 3600.0
         if hours_old < 6:
             score += 1.0
         elif hours_old < 12:
@@ -263,6 +354,33 @@ class RedditIngestor:
             
         return score
         
+    def _score_posts_vectorized(self, posts: List[Dict[str, Any]], now_ts: float) -> np.ndarray:
+        """Calculate quality scores for many posts at once.
+        
+        Same scoring as _calculate_post_score, computed over arrays.
+        
+        Args:
+            posts: Post dictionaries
+            now_ts: Current Unix timestamp
+            
+        Returns:
+            Array of quality scores in post order
+        """
+        scores = np.array([p['score'] for p in posts], dtype=np.float64)
+        comments = np.array([p['num_comments'] for p in posts], dtype=np.float64)
+        ratio = np.array([p.get('upvote_ratio', 0.9) for p in posts], dtype=np.float64)
+        title_length = np.array([len(p['title']) for p in posts])
+        has_content = np.array([bool(p.get('selftext')) and len(p['selftext']) > 100 for p in posts])
+        hours_old = (now_ts - np.array([p['created_utc'] for p in posts], dtype=np.float64)) / 3600.0
+        
+        return (np.minimum(scores / 10000, 2.0)
+                + np.minimum(comments / 500, 1.0)
+                + ratio
+                + np.where((title_length >= 50) & (title_length <= 100), 1.0,
+                           np.where((title_length >= 30) & (title_length <= 150), 0.5, 0.0))
+                + np.where(has_content, 1.0, 0.0)
+                + np.where(hours_old < 6, 1.0, np.where(hours_old < 12, 0.5, 0.0)))
+        
     def save_post(self, post: Dict[str, Any], output_dir: Path) -> Path:
         """Save post data to JSON file.
         
@@ -275,11 +393,10 @@ class RedditIngestor:
         """
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        filename = f"reddit_post_{post['id']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"reddit_post_{post['id']}_{time.strftime('%Y%m%d_%H%M%S')}.json"
         filepath = output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(post, f, indent=2, ensure_ascii=False)
+        dump_json(self._add_post_details(post), filepath)
             
         self.logger.info(f"Saved post to {filepath}")
         return filepath
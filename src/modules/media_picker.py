@@ -1,16 +1,47 @@
 """Media picker module for selecting stock footage."""
 
+import asyncio
 import json
-import requests
+import math
+import os
 import random
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 import time
+import uuid
 import hashlib
+from collections import OrderedDict
+
+import aiohttp
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
+from ..utils.json_io import dump_json
+
+
+# Common words skipped when taking keywords from titles
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'})
+
+# Bytes read per network chunk when downloading clips
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Concurrent search requests per provider host
+SEARCH_CONCURRENCY = 5
+
+# Search budget: clips fetched per clip needed, keywords joined into the
+# first query, and the largest page size both providers accept
+OVERSAMPLE = 1.5
+COMBINED_QUERY_KEYWORDS = 3
+MAX_RESULTS_PER_QUERY = 80
+
+# Maximum number of cached search results
+SEARCH_CACHE_SIZE = 256
+
+# API responses worth retrying, with exponential backoff in seconds
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
 
 
 class MediaPicker:
@@ -32,7 +63,11 @@ class MediaPicker:
         self.quality = self.media_config.get('quality', 'hd')
         self.min_clip_duration = self.media_config.get('min_clip_duration', 3)
         self.max_clip_duration = self.media_config.get('max_clip_duration', 7)
-        self.fallback_keywords = self.media_config.get('fallback_keywords', ['technology', 'nature'])
+        self.fallback_keywords = tuple(kw.lower() for kw in self.media_config.get('fallback_keywords', ['technology', 'nature']))
+        self.download_concurrency = self.media_config.get('download_concurrency', 8)
+        
+        # Search results per (provider, keyword, limit)
+        self._search_cache: "OrderedDict[Tuple[str, str, int], List[Dict[str, Any]]]" = OrderedDict()
         
         # API keys
         self.api_keys = self.config.get_api_keys()
@@ -68,12 +103,10 @@ class MediaPicker:
         if self.dry_run:
             # Generate mock media data
             media_clips = self._generate_mock_media(keywords, num_clips)
+            downloaded_clips = self._download_clips(media_clips, output_dir)
         else:
-            # Fetch real media from APIs
-            media_clips = self._fetch_real_media(keywords, num_clips)
-            
-        # Download media files
-        downloaded_clips = self._download_clips(media_clips, output_dir)
+            # Fetch real media from APIs and download it over one pooled session
+            downloaded_clips = asyncio.run(self._fetch_and_download_async(keywords, num_clips, output_dir))
         
         # Save media metadata
         self._save_media_metadata(downloaded_clips, output_dir, script)
@@ -93,14 +126,13 @@ class MediaPicker:
         
         # Start with b-roll keywords from script
         if 'broll_keywords' in script:
-            keywords.extend(script['broll_keywords'])
+            keywords.extend(kw.lower() for kw in script['broll_keywords'])
             
         # Add keywords from title
         if 'title' in script:
             title_words = script['title'].lower().split()
             # Filter out common words
-            stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-            title_keywords = [w for w in title_words if w not in stop_words and len(w) > 3]
+            title_keywords = [w for w in title_words if w not in STOP_WORDS and len(w) > 3]
             keywords.extend(title_keywords[:5])
             
         # Add topic-specific keywords
@@ -114,14 +146,7 @@ class MediaPicker:
         keywords.extend(self.fallback_keywords)
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_keywords = []
-        for kw in keywords:
-            if kw not in seen:
-                seen.add(kw)
-                unique_keywords.append(kw)
-                
-        return unique_keywords
+        return list(dict.fromkeys(keywords))
         
     def _generate_mock_media(self, keywords: List[str], num_clips: int) -> List[Dict[str, Any]]:
         """Generate mock media data for testing.
@@ -166,31 +191,140 @@ class MediaPicker:
         Returns:
             List of media clip data
         """
-        all_clips = []
-        clips_per_keyword = max(3, num_clips // len(keywords)) if keywords else num_clips
-        
-        for keyword in keywords[:10]:  # Limit to 10 keywords
-            if len(all_clips) >= num_clips:
-                break
-                
-            # Try Pexels first
-            if 'pexels' in self.providers and self.pexels_key:
-                clips = self._search_pexels(keyword, clips_per_keyword)
-                all_clips.extend(clips)
+        async def fetch():
+            async with self._open_session() as session:
+                return await self._fetch_real_media_async(keywords, num_clips, session)
                 
-            # Try Pixabay if needed
-            if len(all_clips) < num_clips and 'pixabay' in self.providers and self.pixabay_key:
-                clips = self._search_pixabay(keyword, clips_per_keyword)
-                all_clips.extend(clips)
+        return asyncio.run(fetch())
+        
+    async def _fetch_and_download_async(self,
+                                        keywords: List[str],
+                                        num_clips: int,
+                                        output_dir: Path) -> List[Dict[str, Any]]:
+        """Search for clips and download them, reusing connections throughout.
+        
+        Args:
+            keywords: Search keywords
+            num_clips: Number of clips needed
+            output_dir: Directory to save media files
+            
+        Returns:
+            List of clips with local file paths
+        """
+        clips_dir = output_dir / 'clips'
+        clips_dir.mkdir(exist_ok=True)
+        
+        async with self._open_session() as session:
+            media_clips = await self._fetch_real_media_async(keywords, num_clips, session)
+            downloaded = await self._download_clips_async(media_clips, clips_dir, session)
+            
+        self.logger.info(f"Downloaded {len(downloaded)}/{len(media_clips)} clips")
+        return downloaded
+        
+    def _open_session(self) -> aiohttp.ClientSession:
+        """Create a pooled HTTP session for searches and downloads.
+        
+        Returns:
+            Client session with keep-alive connection pooling
+        """
+        connector = aiohttp.TCPConnector(limit=16, limit_per_host=SEARCH_CONCURRENCY)
+        return aiohttp.ClientSession(connector=connector)
+        
+    async def _fetch_real_media_async(self,
+                                      keywords: List[str],
+                                      num_clips: int,
+                                      session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
+        """Search all keywords on each provider concurrently.
+        
+        Args:
+            keywords: Search keywords
+            num_clips: Number of clips needed
+            session: Shared HTTP session
+            
+        Returns:
+            List of media clip data
+        """
+        all_clips: Dict[str, Dict[str, Any]] = {}
+        clips_per_keyword = max(3, num_clips // len(keywords)) if keywords else num_clips
+        search_keywords = keywords[:10]  # Limit to 10 keywords
+        # Oversample a little so the final random pick has some variety
+        target = math.ceil(num_clips * OVERSAMPLE)
+        
+        # Try Pexels first, then Pixabay if needed
+        for provider, search, api_key in (('pexels', self._search_pexels, self.pexels_key),
+                                          ('pixabay', self._search_pixabay, self.pixabay_key)):
+            if len(all_clips) >= target or provider not in self.providers or not api_key:
+                continue
                 
-        # Shuffle and trim to exact number needed
-        random.shuffle(all_clips)
-        return all_clips[:num_clips]
+            # One combined query for the leading keywords usually covers most clips
+            if len(search_keywords) > 1:
+                combined = ' '.join(search_keywords[:COMBINED_QUERY_KEYWORDS])
+                limit = min(max(3, target - len(all_clips)), MAX_RESULTS_PER_QUERY)
+                for clip in await self._search_keywords(provider, search, session, [combined], limit):
+                    clip['keyword'] = search_keywords[0]
+                    all_clips.setdefault(clip['id'], clip)
+                    
+            # Then search single keywords, only as many as are still needed
+            missing = target - len(all_clips)
+            if missing > 0:
+                needed = search_keywords[:math.ceil(missing / clips_per_keyword)]
+                for clip in await self._search_keywords(provider, search, session, needed, clips_per_keyword):
+                    all_clips.setdefault(clip['id'], clip)
+                    
+        # Randomly pick the exact number needed
+        clips = list(all_clips.values())
+        return random.sample(clips, min(num_clips, len(clips)))
+        
+    async def _search_keywords(self,
+                               provider: str,
+                               search,
+                               session: aiohttp.ClientSession,
+                               keywords: List[str],
+                               limit: int) -> List[Dict[str, Any]]:
+        """Run one provider's searches for all keywords at once.
+        
+        Results are cached per (provider, keyword, limit), so repeat queries
+        within a run don't hit the API again.
         
-    def _search_pexels(self, keyword: str, limit: int = 5) -> List[Dict[str, Any]]:
+        Args:
+            provider: Provider name used in the cache key
+            search: Provider search coroutine
+            session: Shared HTTP session
+            keywords: Search terms
+            limit: Maximum number of results per keyword
+            
+        Returns:
+            Clip data for all keywords, in keyword order
+        """
+        async def cached_search(keyword: str) -> List[Dict[str, Any]]:
+            key = (provider, keyword, limit)
+            if key not in self._search_cache:
+                self._search_cache[key] = await search(session, keyword, limit)
+                if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+            else:
+                self._search_cache.move_to_end(key)
+            # Downloads annotate clip dicts, so hand out copies
+            return [dict(clip) for clip in self._search_cache[key]]
+            
+        results = await asyncio.gather(*[cached_search(kw) for kw in keywords], return_exceptions=True)
+        
+        clips = []
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"{provider.capitalize()} search error: {result}")
+            else:
+                clips.extend(result)
+        return clips
+        
+    async def _search_pexels(self,
+                             session: aiohttp.ClientSession,
+                             keyword: str,
+                             limit: int = 5) -> List[Dict[str, Any]]:
         """Search Pexels for video clips.
         
         Args:
+            session: Shared HTTP session
             keyword: Search term
             limit: Maximum number of results
             
@@ -208,30 +342,23 @@ class MediaPicker:
                 'size': 'medium' if self.quality == 'hd' else 'small'
             }
             
-            response = requests.get(
+            data = await self._get_json(
+                session,
                 'https://api.pexels.com/videos/search',
+                'Pexels',
                 headers=headers,
-                params=params,
-                timeout=10
+                params=params
             )
-            
-            if response.status_code != 200:
-                self.logger.warning(f"Pexels API error: {response.status_code}")
+            if data is None:
                 return []
                 
-            data = response.json()
             clips = []
             
+            want_hd = self.quality == 'hd'
             for video in data.get('videos', [])[:limit]:
                 # Find appropriate quality file
-                video_file = None
-                for file in video.get('video_files', []):
-                    if self.quality == 'hd' and file.get('quality') == 'hd':
-                        video_file = file
-                        break
-                    elif self.quality != 'hd':
-                        video_file = file
-                        break
+                video_file = next((file for file in video.get('video_files', ())
+                                   if not want_hd or file.get('quality') == 'hd'), None)
                         
                 if video_file:
                     clips.append({
@@ -255,10 +382,14 @@ class MediaPicker:
             self.logger.error(f"Pexels search error: {e}")
             return []
             
-    def _search_pixabay(self, keyword: str, limit: int = 5) -> List[Dict[str, Any]]:
+    async def _search_pixabay(self,
+                              session: aiohttp.ClientSession,
+                              keyword: str,
+                              limit: int = 5) -> List[Dict[str, Any]]:
         """Search Pixabay for video clips.
         
         Args:
+            session: Shared HTTP session
             keyword: Search term
             limit: Maximum number of results
             
@@ -276,17 +407,15 @@ class MediaPicker:
                 'per_page': limit
             }
             
-            response = requests.get(
+            data = await self._get_json(
+                session,
                 'https://pixabay.com/api/videos/',
-                params=params,
-                timeout=10
+                'Pixabay',
+                params=params
             )
-            
-            if response.status_code != 200:
-                self.logger.warning(f"Pixabay API error: {response.status_code}")
+            if data is None:
                 return []
                 
-            data = response.json()
             clips = []
             
             for video in data.get('hits', [])[:limit]:
@@ -316,6 +445,36 @@ class MediaPicker:
             self.logger.error(f"Pixabay search error: {e}")
             return []
             
+    async def _get_json(self,
+                        session: aiohttp.ClientSession,
+                        url: str,
+                        provider: str,
+                        **kwargs) -> Optional[Dict[str, Any]]:
+        """GET a JSON API response, retrying rate limits and server errors.
+        
+        Args:
+            session: Shared HTTP session
+            url: API endpoint
+            provider: Provider name for log messages
+            **kwargs: Extra arguments for session.get
+            
+        Returns:
+            Decoded response body, or None on a non-retryable error
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10), **kwargs) as response:
+                    if response.status == 200:
+                        return await response.json()
+                    if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                        self.logger.warning(f"{provider} API error: {response.status}")
+                        return None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == MAX_RETRIES:
+                    raise
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+        return None
+        
     def _download_clips(self, clips: List[Dict[str, Any]], output_dir: Path) -> List[Dict[str, Any]]:
         """Download media clips to local storage.
         
@@ -326,65 +485,172 @@ class MediaPicker:
         Returns:
             List of clips with local file paths
         """
-        downloaded = []
         clips_dir = output_dir / 'clips'
         clips_dir.mkdir(exist_ok=True)
         
-        for i, clip in enumerate(clips):
-            if self.dry_run:
+        if self.dry_run:
+            downloaded = []
+            for i, clip in enumerate(clips):
                 # For dry run, just create empty files
-                filename = f"clip_{i:03d}_{clip['keyword']}.mp4"
+                filename = self._clip_filename(i, clip)
                 filepath = clips_dir / filename
                 filepath.touch()
                 clip['local_path'] = str(filepath)
                 clip['downloaded'] = True
                 downloaded.append(clip)
-                
-            else:
-                # Download real file
-                download_url = clip.get('download_url', '')
-                if download_url:
-                    filename = f"clip_{i:03d}_{clip['keyword']}.mp4"
-                    filepath = clips_dir / filename
+        else:
+            async def download():
+                async with self._open_session() as session:
+                    return await self._download_clips_async(clips, clips_dir, session)
                     
-                    if self._download_file(download_url, filepath):
-                        clip['local_path'] = str(filepath)
-                        clip['downloaded'] = True
-                        downloaded.append(clip)
-                    else:
-                        self.logger.warning(f"Failed to download clip: {clip['id']}")
+            downloaded = asyncio.run(download())
                         
         self.logger.info(f"Downloaded {len(downloaded)}/{len(clips)} clips")
         return downloaded
         
-    def _download_file(self, url: str, filepath: Path) -> bool:
+    async def _download_clips_async(self,
+                                    clips: List[Dict[str, Any]],
+                                    clips_dir: Path,
+                                    session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
+        """Download clips concurrently over one shared HTTP session.
+        
+        Args:
+            clips: List of clip metadata
+            clips_dir: Directory to save clips
+            session: Shared HTTP session
+            
+        Returns:
+            Downloaded clips with local file paths, in input order
+        """
+        semaphore = asyncio.Semaphore(self.download_concurrency)
+        
+        async def download(i: int, clip: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            download_url = clip.get('download_url', '')
+            if not download_url:
+                return None
+                
+            filename = self._clip_filename(i, clip)
+            filepath = clips_dir / filename
+            
+            async with semaphore:
+                success = await self._download_file(session, download_url, filepath)
+                
+            if success:
+                clip['local_path'] = str(filepath)
+                clip['downloaded'] = True
+                return clip
+                
+            self.logger.warning(f"Failed to download clip: {clip['id']}")
+            return None
+            
+        results = await asyncio.gather(*[download(i, clip) for i, clip in enumerate(clips)])
+        return [clip for clip in results if clip is not None]
+        
+    @staticmethod
+    def _clip_filename(index: int, clip: Dict[str, Any]) -> str:
+        """Build the local file name for a clip.
+        
+        Clip selection is random, so the same index holds different clips
+        across runs. The download URL hash keeps a leftover file or ``.part``
+        from another clip from being reused or resumed.
+        
+        Args:
+            index: Position of the clip in the selection
+            clip: Clip metadata
+            
+        Returns:
+            File name for the clip
+        """
+        url_hash = hashlib.sha1(clip.get('download_url', '').encode('utf-8')).hexdigest()[:12]
+        return f"clip_{index:03d}_{clip['keyword']}_{url_hash}.mp4"
+        
+    async def _download_file(self, session: aiohttp.ClientSession, url: str, filepath: Path) -> bool:
         """Download a file from URL.
         
+        Data is written to a ``.part`` file that is renamed when complete, so
+        an interrupted download is resumed with a Range request next time.
+        The response's ETag (or Last-Modified) is stored next to the partial
+        file and sent as If-Range, so a changed remote file is sent whole
+        instead of being appended to stale data.
+        
         Args:
+            session: Shared HTTP session
             url: Download URL
             filepath: Local file path
             
         Returns:
             True if successful
         """
+        part_path = filepath.with_name(filepath.name + '.part')
+        validator_path = filepath.with_name(filepath.name + '.part.etag')
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+        
         try:
-            # Check if file already exists
+            # Skip files that are already complete
             if filepath.exists():
-                return True
+                expected_size = await self._content_length(session, url, timeout)
+                if expected_size is None or filepath.stat().st_size == expected_size:
+                    return True
+                filepath.unlink()
                 
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
+            # Only resume when the partial file's version can be checked
+            validator = validator_path.read_text() if validator_path.exists() else ''
+            offset = part_path.stat().st_size if part_path.exists() and validator else 0
+            headers = {'Range': f'bytes={offset}-', 'If-Range': validator} if offset else {}
             
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    
+            async with session.get(url, headers=headers, timeout=timeout) as response:
+                if response.status == 416:
+                    # Partial file doesn't fit the remote one, start over
+                    part_path.unlink()
+                    validator_path.unlink(missing_ok=True)
+                    return await self._download_file(session, url, filepath)
+                response.raise_for_status()
+                
+                # 206 continues the partial file, 200 means the server sent it all
+                if response.status == 206:
+                    mode = 'ab'
+                else:
+                    mode = 'wb'
+                    validator = (response.headers.get('ETag')
+                                 or response.headers.get('Last-Modified', ''))
+                    if validator:
+                        validator_path.write_text(validator)
+                    else:
+                        validator_path.unlink(missing_ok=True)
+                with open(part_path, mode) as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        
+            os.replace(part_path, filepath)
+            validator_path.unlink(missing_ok=True)
             return True
             
         except Exception as e:
             self.logger.error(f"Download failed: {e}")
             return False
             
+    async def _content_length(self,
+                              session: aiohttp.ClientSession,
+                              url: str,
+                              timeout: aiohttp.ClientTimeout) -> Optional[int]:
+        """Get the size of a remote file with a HEAD request.
+        
+        Args:
+            session: Shared HTTP session
+            url: Download URL
+            timeout: Request timeout
+            
+        Returns:
+            Content length in bytes, or None if unknown
+        """
+        try:
+            async with session.head(url, allow_redirects=True, timeout=timeout) as response:
+                if response.status != 200:
+                    return None
+                return response.content_length
+        except aiohttp.ClientError:
+            return None
+            
     def _save_media_metadata(self, clips: List[Dict[str, Any]], output_dir: Path, script: Dict[str, Any]):
         """Save media selection metadata.
         
@@ -393,8 +659,9 @@ class MediaPicker:
             output_dir: Output directory
             script: Original script
         """
+        now = datetime.now()
         metadata = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now.isoformat(),
             'script_title': script.get('title', ''),
             'post_id': script.get('post_id', ''),
             'num_clips': len(clips),
@@ -404,9 +671,9 @@ class MediaPicker:
             'clips': clips
         }
         
-        metadata_path = output_dir / f"media_metadata_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        # Suffix keeps two saves within the same second from overwriting each other
+        metadata_path = output_dir / f"media_metadata_{now:%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}.json"
+        dump_json(metadata, metadata_path)
             
         self.logger.info(f"Saved media metadata to {metadata_path}")
 
@@ -1,22 +1,205 @@
 """LLM-based script generation module."""
 
+import asyncio
+import hashlib
 import json
 import math
-from typing import Dict, List, Any, Optional
+import copy
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 import re
 
+import aiohttp
+import httpx
+import numpy as np
 from openai import OpenAI
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
+from ..utils.json_io import dump_json, dumps_json, loads_json
+from ..utils.rate_limiter import RateLimiter
+from ..utils.semantic_cache import SemanticScriptCache
+
+
+# Chat completions endpoint for concurrent generation over aiohttp
+CHAT_COMPLETIONS_URL = 'https://api.openai.com/v1/chat/completions'
+
+# Rate limits and transient server errors are retried with exponential backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0
+
+# Rough token estimate for rate limiting (about 4 characters per token in English)
+CHARS_PER_TOKEN = 4
+
+# Bytes str.split() treats as whitespace (ASCII range), for bulk word counts
+WHITESPACE_BYTES = np.zeros(256, dtype=bool)
+WHITESPACE_BYTES[[0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x20]] = True
+
+# Exact-duplicate LLM inputs (e.g. cross-posts) are served from memory
+LLM_CACHE_SIZE = 512
+
+# Completion budget: narration tokens per word plus room for the JSON structure
+TOKENS_PER_WORD = 1.4
+SCRIPT_OVERHEAD_TOKENS = 256
+
+# This would normally load from Claude.md, but we'll use a simplified version
+SYSTEM_PROMPT = """You are a YouTube script generator for a faceless channel.
+Generate scripts that are engaging, informative, and YouTube-friendly.
+Output must be valid JSON matching the script.v1 schema.
+Keep content PG-13, avoid copyright issues, and optimize for retention.
+Target the specified duration precisely. Return ONLY valid JSON."""
+
+# Identifies the prompt version in local response cache keys
+SYSTEM_PROMPT_HASH = hashlib.sha256(SYSTEM_PROMPT.encode('utf-8')).hexdigest()
+
+# Output schema, sent in the system message so it is part of the cached prompt prefix
+SCRIPT_SCHEMA_SPEC = """script.v1 schema (a single JSON object with exactly these keys):
+{
+  "version": "script.v1",
+  "policy_checklist": {
+    "copyright_risk": boolean,
+    "medical_or_financial_claims": boolean,
+    "nsfw": boolean,
+    "shocking_or_graphic": boolean
+  },
+  "title": string, at most 100 characters, no clickbait lies,
+  "hook": string, one or two sentences spoken in the first 10 seconds,
+  "narration": {
+    "intro": string, 40-80 words that set up the topic and promise a payoff,
+    "chapters": [
+      {"id": integer starting at 1, "heading": short string, "body": string}
+    ],
+    "outro": string, 40-80 words with a recap and a call to subscribe
+  },
+  "broll_keywords": array of 5-15 short stock footage search terms,
+  "disclaimers": array of strings (empty if none are needed)
+}
+Rules:
+- Write policy_checklist first, right after version.
+- Spread the word budget across chapters; narration is read at about 165 words per minute.
+- Chapter bodies are plain spoken prose: no markdown, bullet points, emojis or stage directions.
+- Never quote the source post at length; summarize and add context instead.
+- Never use any of the banned terms listed under BRAND.
+- Add a disclaimer and set medical_or_financial_claims when the script touches health, money or law.
+- broll_keywords must be concrete and visual (e.g. "city traffic", not "importance")."""
+
+# First number in a listicle title ("Top 10 ...") sets the chapter count
+NUMBER_PATTERN = re.compile(r'\d+')
+
+# Fixed parts of the template scripts
+LISTICLE_BROLL = ('countdown', 'numbers', 'facts', 'discovery', 'amazing')
+NEWS_BROLL = ('technology', 'innovation', 'future', 'digital', 'breakthrough')
+EXPLAINER_BROLL = ('education', 'learning', 'explanation', 'diagram', 'concept')
+NEWS_HEADINGS = ('The Announcement', 'Key Features', 'Industry Impact', 'Expert Analysis', "What's Next")
+EXPLAINER_HEADINGS = ('The Basics', 'How It Works', 'Real-World Examples', 'Common Misconceptions', 'Key Takeaways')
+DEFAULT_POLICY_CHECKLIST = MappingProxyType({
+    'copyright_risk': False,
+    'medical_or_financial_claims': False,
+    'nsfw': False,
+    'shocking_or_graphic': False
+})
+
+# Filler sentences appended to template chapters that are short of their word target
+CHAPTER_PADDING = (
+    "This is particularly interesting when you consider the broader implications.",
+    "Experts in the field have noted the significance of this development.",
+    "The data shows a clear trend that supports this conclusion.",
+    "Many people don't realize how important this actually is.",
+    "Let's take a moment to understand what this really means.",
+)
+
+# A script the LLM itself flags as a copyright risk is discarded. Only the
+# flag inside the policy_checklist object counts; escaped quotes mean the
+# text is inside a string such as narration
+POLICY_CHECKLIST_PATTERN = re.compile(r'(?<!\\)"policy_checklist"\s*:\s*\{')
+COPYRIGHT_RISK_PATTERN = re.compile(
+    r'(?<!\\)"policy_checklist"\s*:\s*\{[^{}]*?(?<!\\)"copyright_risk"\s*:\s*true'
+)
+
+
+class CopyrightRiskError(ValueError):
+    """The LLM flagged a script as a copyright risk; the post should be skipped."""
+
+
+# OpenAI clients shared across ScriptGenerator instances, keyed by API key
+_CLIENT_CACHE: Dict[str, OpenAI] = {}
+
+
+def _get_openai_client(api_key: str) -> OpenAI:
+    """Get a shared OpenAI client so its connection pool is reused.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        OpenAI client with keep-alive connection pooling
+    """
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        client = OpenAI(
+            api_key=api_key,
+            max_retries=3,
+            timeout=60.0,
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        )
+        _CLIENT_CACHE[api_key] = client
+    return client
+
+
+@lru_cache(maxsize=1024)
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words, memoized per text.
+    
+    str.split is the fastest word count available in CPython; the cache makes
+    repeat counts of the same script (validate, save, duration) O(1).
+    
+    Args:
+        text: Narration text
+        
+    Returns:
+        Number of words
+    """
+    return len(text.split())
+
+
+def _scan_stream_delta(tail: str, delta: str) -> str:
+    """Check streamed LLM output for a copyright risk flag as it arrives.
+    
+    Args:
+        tail: End of the content received so far
+        delta: Newly received content
+        
+    Returns:
+        New tail to pass with the next delta
+        
+    Raises:
+        CopyrightRiskError: If the script is flagged as a copyright risk
+    """
+    window = tail + delta
+    if COPYRIGHT_RISK_PATTERN.search(window):
+        raise CopyrightRiskError("LLM flagged the script as a copyright risk")
+    # Keep an open policy_checklist object whole until it is closed
+    match = POLICY_CHECKLIST_PATTERN.search(window)
+    if match and '}' not in window[match.end():]:
+        return window[match.start():]
+    return window[-64:]
 
 
 class ScriptGenerator:
     """Generates YouTube video scripts using LLM and templates."""
     
+    # Jinja2 environment shared by all instances, so templates are compiled once
+    _env: Optional[Environment] = None
+    
     def __init__(self, dry_run: bool = False):
         """Initialize script generator.
         
@@ -28,10 +211,12 @@ class ScriptGenerator:
         self.dry_run = dry_run
         
         # Initialize LLM client
+        self.api_key = None
         if not dry_run:
             api_key = self.config.get_env('OPENAI_API_KEY')
             if api_key:
-                self.client = OpenAI(api_key=api_key)
+                self.api_key = api_key
+                self.client = _get_openai_client(api_key)
             else:
                 self.logger.warning("No OpenAI API key found, using template-only mode")
                 self.client = None
@@ -40,16 +225,63 @@ class ScriptGenerator:
             self.client = None
             
         # Initialize Jinja2 environment
-        template_dir = Path(__file__).parent.parent / 'templates'
-        template_dir.mkdir(exist_ok=True)
-        self.env = Environment(loader=FileSystemLoader(template_dir))
+        self.env = self._get_env(self.config.get_paths()['cache_dir'] / 'jinja')
         
         # Load LLM configuration
         self.llm_config = self.config.get('llm', {})
         self.model = self.llm_config.get('model', 'gpt-4')
         self.temperature = self.llm_config.get('temperature', 0.3)
         self.top_p = self.llm_config.get('top_p', 0.9)
-        self.max_tokens = self.llm_config.get('max_tokens', 2000)
+        self.max_tokens = self.llm_config.get('max_tokens', 4096)
+        self.batch_poll_interval = self.llm_config.get('batch_poll_interval', 30)
+        self.max_concurrency = self.llm_config.get('max_concurrency', 8)
+        
+        # Keeps concurrent calls under the account's RPM/TPM; refined from response headers
+        self.rate_limiter = RateLimiter(
+            self.config.get('rate_limits.openai.requests_per_minute', 500),
+            self.config.get('rate_limits.openai.tokens_per_minute', 200000)
+        )
+        
+        # System messages per style; identical across posts so the provider can cache them
+        self._system_messages: Dict[str, str] = {}
+        
+        # LLM scripts per request hash, in LRU order
+        self._llm_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Reuse scripts of near-duplicate posts (same story, different subreddit/title)
+        self.embedding_model = self.llm_config.get('embedding_model', 'text-embedding-3-small')
+        self.semantic_cache = None
+        if self.llm_config.get('semantic_cache_enabled', False):
+            self.semantic_cache = SemanticScriptCache(
+                self.config.get_paths()['cache_dir'],
+                self.llm_config.get('semantic_cache_threshold', 0.92),
+                SYSTEM_PROMPT_HASH
+            )
+        
+    @classmethod
+    def _get_env(cls, bytecode_dir: Path) -> Environment:
+        """Get the shared Jinja2 environment, creating it on first use.
+        
+        Templates are not checked for changes on disk, and compiled bytecode
+        is cached across runs.
+        
+        Args:
+            bytecode_dir: Directory for compiled template bytecode
+            
+        Returns:
+            Jinja2 environment
+        """
+        if cls._env is None:
+            template_dir = Path(__file__).parent.parent / 'templates'
+            template_dir.mkdir(exist_ok=True)
+            bytecode_dir.mkdir(parents=True, exist_ok=True)
+            cls._env = Environment(
+                loader=FileSystemLoader(template_dir),
+                auto_reload=False,
+                cache_size=400,
+                bytecode_cache=FileSystemBytecodeCache(directory=str(bytecode_dir))
+            )
+        return cls._env
         
     def generate_script(self, 
                        post: Dict[str, Any], 
@@ -64,6 +296,9 @@ class ScriptGenerator:
             
         Returns:
             Script dictionary in script.v1 format
+            
+        Raises:
+            CopyrightRiskError: If the LLM flags the script as a copyright risk
         """
         if target_minutes is None:
             target_minutes = self.config.get('video.target_minutes', 10)
@@ -80,15 +315,302 @@ class ScriptGenerator:
             # Use LLM generation
             script = self._generate_with_llm(post, topic_config, target_words)
             
-        # Validate and adjust script
-        script = self._validate_script(script)
+        return self._finalize_script(script, post, target_minutes)
         
-        # Add metadata
-        script['generated_at'] = datetime.now().isoformat()
-        script['post_id'] = post.get('id', 'unknown')
-        script['target_minutes'] = target_minutes
+    def generate_scripts(self,
+                         posts: List[Dict[str, Any]],
+                         topic_configs: List[Dict[str, Any]],
+                         target_minutes: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+        """Generate scripts for several posts with concurrent LLM calls.
         
-        return script
+        Args:
+            posts: Reddit post data
+            topic_configs: Topic configuration for each post
+            target_minutes: Target video duration
+            
+        Returns:
+            Script dictionaries in script.v1 format, in the order of ``posts``;
+            None for posts skipped as a copyright risk
+        """
+        return asyncio.run(self.generate_scripts_async(posts, topic_configs, target_minutes))
+        
+    async def generate_scripts_async(self,
+                                     posts: List[Dict[str, Any]],
+                                     topic_configs: List[Dict[str, Any]],
+                                     target_minutes: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+        """Generate scripts concurrently, at most llm.max_concurrency at a time.
+        
+        Args:
+            posts: Reddit post data
+            topic_configs: Topic configuration for each post
+            target_minutes: Target video duration
+            
+        Returns:
+            Script dictionaries in script.v1 format, in the order of ``posts``;
+            None for posts skipped as a copyright risk
+        """
+        if self.dry_run or not self.client:
+            return [self.generate_script(post, topic_config, target_minutes)
+                    for post, topic_config in zip(posts, topic_configs)]
+            
+        if target_minutes is None:
+            target_minutes = self.config.get('video.target_minutes', 10)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def generate(i, session):
+            async with semaphore:
+                try:
+                    return await self.agenerate_script(posts[i], topic_configs[i], target_minutes, session)
+                except CopyrightRiskError as e:
+                    self.logger.warning(f"Skipping post {posts[i].get('id', 'unknown')}: {e}")
+                    return None
+                
+        # Generate each distinct input once; duplicates then hit the exact-match cache
+        first_seen: Dict[str, int] = {}
+        for i, (post, topic_config) in enumerate(zip(posts, topic_configs)):
+            first_seen.setdefault(self._llm_cache_key(post, topic_config, target_minutes * 165), i)
+        unique = sorted(first_seen.values())
+        rest = sorted(set(range(len(posts))) - set(unique))
+        
+        async with self._open_session() as session:
+            scripts = dict(zip(unique, await asyncio.gather(*(generate(i, session) for i in unique))))
+            scripts.update(zip(rest, await asyncio.gather(*(generate(i, session) for i in rest))))
+        return [scripts[i] for i in range(len(posts))]
+            
+    async def agenerate_script(self,
+                               post: Dict[str, Any],
+                               topic_config: Dict[str, Any],
+                               target_minutes: Optional[int] = None,
+                               session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
+        """Generate script for video without blocking the event loop.
+        
+        Args:
+            post: Reddit post data
+            topic_config: Topic configuration
+            target_minutes: Target video duration
+            session: Shared HTTP session (a new one is opened if omitted)
+            
+        Returns:
+            Script dictionary in script.v1 format
+            
+        Raises:
+            CopyrightRiskError: If the LLM flags the script as a copyright risk
+        """
+        if self.dry_run or not self.client:
+            return self.generate_script(post, topic_config, target_minutes)
+            
+        if session is None:
+            async with self._open_session() as session:
+                return await self.agenerate_script(post, topic_config, target_minutes, session)
+                
+        if target_minutes is None:
+            target_minutes = self.config.get('video.target_minutes', 10)
+        target_words = target_minutes * 165
+        
+        self.logger.info(f"Generating {target_minutes}-minute script ({target_words} words)")
+        
+        cache_key = self._llm_cache_key(post, topic_config, target_words)
+        script, embedding = self._get_cached_llm_script(cache_key), None
+        if script is None and self.semantic_cache is not None:
+            script, embedding = (await asyncio.to_thread(
+                self._check_semantic_cache, [post], [topic_config], target_words
+            ))[0]
+        if script is not None:
+            return self._finalize_script(script, post, target_minutes)
+            
+        try:
+            content = await self._post_chat_completion(
+                session, self._llm_request_body(post, topic_config, target_words)
+            )
+            script = self._parse_llm_script(content)
+            self._store_semantic_cache(embedding, script, post, topic_config, target_words)
+            self._put_cached_llm_script(cache_key, script)
+        except CopyrightRiskError:
+            # The template would paste the source post in; skip it instead
+            raise
+        except Exception as e:
+            self.logger.error(f"LLM generation failed: {e}")
+            # Fallback to template generation
+            script = self._generate_from_template(post, topic_config, target_words)
+            
+        return self._finalize_script(script, post, target_minutes)
+        
+    def _open_session(self) -> aiohttp.ClientSession:
+        """Create a pooled HTTP session for the chat completions API.
+        
+        Returns:
+            Client session with keep-alive connection pooling
+        """
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'Authorization': f"Bearer {self.api_key}"}
+        )
+        
+    async def _post_chat_completion(self,
+                                    session: aiohttp.ClientSession,
+                                    body: Dict[str, Any]) -> str:
+        """POST a chat completion request, retrying rate limits and server errors.
+        
+        Args:
+            session: Shared HTTP session
+            body: Request body from _llm_request_body
+            
+        Returns:
+            Message content of the first choice
+            
+        Raises:
+            RuntimeError: If the API returns a non-retryable error or retries run out
+            CopyrightRiskError: If the streamed script is flagged as a copyright risk
+        """
+        prompt_chars = sum(len(message['content']) for message in body['messages'])
+        est_tokens = prompt_chars // CHARS_PER_TOKEN + body['max_tokens']
+        
+        for attempt in range(MAX_RETRIES + 1):
+            delay = RETRY_BACKOFF * 2 ** attempt
+            await self.rate_limiter.acquire(est_tokens)
+            try:
+                async with session.post(CHAT_COMPLETIONS_URL,
+                                        json={**body, 'stream': True, 'stream_options': {'include_usage': True}},
+                                        timeout=aiohttp.ClientTimeout(total=120)) as response:
+                    self._update_rate_limits(response.headers)
+                    if response.status == 200:
+                        return await self._read_event_stream(response, body['max_tokens'])
+                    if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                        raise RuntimeError(f"OpenAI API error: {response.status}")
+                    # Honor the server's back-off hint on rate limits
+                    try:
+                        delay = max(delay, float(response.headers.get('Retry-After', 0)))
+                    except ValueError:
+                        pass
+                    if response.status == 429:
+                        self.rate_limiter.pause(delay)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == MAX_RETRIES:
+                    raise
+            await asyncio.sleep(delay)
+        raise RuntimeError("OpenAI API retries exhausted")
+        
+    def generate_scripts_batch(self,
+                               posts: List[Dict[str, Any]],
+                               topic_configs: List[Dict[str, Any]],
+                               target_minutes: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+        """Generate scripts for several posts through the OpenAI Batch API.
+        
+        Batch requests run asynchronously at a discount and with higher rate
+        limits, so this suits offline runs over a queue of posts. The call
+        blocks, polling until the batch finishes. Posts whose request failed
+        fall back to template generation.
+        
+        Args:
+            posts: Reddit post data
+            topic_configs: Topic configuration for each post
+            target_minutes: Target video duration
+            
+        Returns:
+            Script dictionaries in script.v1 format, in the order of ``posts``;
+            None for posts skipped as a copyright risk
+        """
+        if target_minutes is None:
+            target_minutes = self.config.get('video.target_minutes', 10)
+        target_words = target_minutes * 165
+        
+        if self.dry_run or not self.client:
+            return [self.generate_script(post, topic_config, target_minutes)
+                    for post, topic_config in zip(posts, topic_configs)]
+            
+        self.logger.info(f"Submitting batch of {len(posts)} scripts ({target_words} words each)")
+        
+        keys = [self._llm_cache_key(post, topic_config, target_words)
+                for post, topic_config in zip(posts, topic_configs)]
+        cached = [self._get_cached_llm_script(key) for key in keys]
+        embeddings: List[Optional[List[float]]] = [None] * len(posts)
+        missing = [i for i, script in enumerate(cached) if script is None]
+        semantic_hits = self._check_semantic_cache([posts[i] for i in missing],
+                                                   [topic_configs[i] for i in missing],
+                                                   target_words)
+        for i, (script, embedding) in zip(missing, semantic_hits):
+            cached[i], embeddings[i] = script, embedding
+            
+        # One request per distinct input; duplicates share its result
+        first_seen: Dict[str, int] = {}
+        for i, script in enumerate(cached):
+            if script is None:
+                first_seen.setdefault(keys[i], i)
+                
+        contents = {}
+        try:
+            requests = [
+                {
+                    'custom_id': str(i),
+                    'method': 'POST',
+                    'url': '/v1/chat/completions',
+                    'body': self._llm_request_body(posts[i], topic_configs[i], target_words)
+                }
+                for i in first_seen.values()
+            ]
+            if requests:
+                contents = self._run_batch(requests)
+        except Exception as e:
+            self.logger.error(f"Batch generation failed: {e}")
+            
+        scripts = []
+        generated_at = datetime.now().isoformat()
+        for i, (post, topic_config) in enumerate(zip(posts, topic_configs)):
+            script = cached[i]
+            if script is None:
+                source = first_seen[keys[i]]
+                try:
+                    script = self._parse_llm_script(contents[str(source)])
+                    if source == i:
+                        self._store_semantic_cache(embeddings[i], script, post, topic_config, target_words)
+                        self._put_cached_llm_script(keys[i], script)
+                except CopyrightRiskError as e:
+                    self.logger.warning(f"Skipping post {post.get('id', 'unknown')}: {e}")
+                    scripts.append(None)
+                    continue
+                except (KeyError, ValueError) as e:
+                    self.logger.error(f"LLM generation failed for post {post.get('id', 'unknown')}: {e}")
+                    script = self._generate_from_template(post, topic_config, target_words)
+            scripts.append(self._finalize_script(script, post, target_minutes, generated_at))
+            
+        return scripts
+        
+    def _run_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Upload a batch of chat completion requests and wait for the results.
+        
+        Args:
+            requests: Batch API request lines
+            
+        Returns:
+            Message content keyed by custom_id, for requests that succeeded
+        """
+        data = b'\n'.join(dumps_json(request, indent=False) for request in requests)
+        batch_file = self.client.files.create(file=('scripts.jsonl', data), purpose='batch')
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h'
+        )
+        
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            time.sleep(self.batch_poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+            
+        contents = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = loads_json(line)
+            response = result.get('response') or {}
+            if response.get('status_code') == 200:
+                contents[result['custom_id']] = response['body']['choices'][0]['message']['content']
+                
+        self.logger.info(f"Batch {batch.id} completed: {len(contents)}/{len(requests)} succeeded")
+        return contents
         
     def _generate_from_template(self, 
                                post: Dict[str, Any], 
@@ -125,10 +647,12 @@ class ScriptGenerator:
         title = post.get('title', 'Top Amazing Facts')
         
         # Extract number from title if present
-        numbers = re.findall(r'\d+', title)
-        if numbers:
-            chapters = min(int(numbers[0]), 10)  # Cap at 10
+        number = NUMBER_PATTERN.search(title)
+        if number:
+            chapters = min(int(number.group()), 10)  # Cap at 10
             
+        body = self._generate_chapter_content(post, words_per)
+        
         return {
             'version': 'script.v1',
             'title': title[:100],
@@ -142,7 +666,7 @@ class ScriptGenerator:
                     {
                         'id': i + 1,
                         'heading': f"Number {chapters - i}",
-                        'body': self._generate_chapter_content(post, i, words_per)
+                        'body': body
                     }
                     for i in range(chapters)
                 ],
@@ -151,20 +675,17 @@ class ScriptGenerator:
                         "please give it a thumbs up and subscribe for more amazing content. "
                         "Click the bell icon to never miss an update. See you in the next one!"
             },
-            'broll_keywords': ['countdown', 'numbers', 'facts', 'discovery', 'amazing'],
+            'broll_keywords': list(LISTICLE_BROLL),
             'disclaimers': [],
-            'policy_checklist': {
-                'copyright_risk': False,
-                'medical_or_financial_claims': False,
-                'nsfw': False,
-                'shocking_or_graphic': False
-            }
+            'policy_checklist': dict(DEFAULT_POLICY_CHECKLIST)
         }
         
     def _generate_news_script(self, post: Dict[str, Any], chapters: int, words_per: int) -> Dict[str, Any]:
         """Generate news-style script."""
         title = post.get('title', 'Breaking News')
         
+        body = self._generate_chapter_content(post, words_per)
+        
         return {
             'version': 'script.v1',
             'title': title[:100],
@@ -176,8 +697,8 @@ class ScriptGenerator:
                 'chapters': [
                     {
                         'id': i + 1,
-                        'heading': ['The Announcement', 'Key Features', 'Industry Impact', 'Expert Analysis', 'What\'s Next'][i % 5],
-                        'body': self._generate_chapter_content(post, i, words_per)
+                        'heading': NEWS_HEADINGS[i % 5],
+                        'body': body
                     }
                     for i in range(min(chapters, 5))
                 ],
@@ -185,20 +706,17 @@ class ScriptGenerator:
                         "so make sure to subscribe and hit the notification bell for the latest. "
                         "Share your thoughts in the comments. Thanks for watching!"
             },
-            'broll_keywords': ['technology', 'innovation', 'future', 'digital', 'breakthrough'],
+            'broll_keywords': list(NEWS_BROLL),
             'disclaimers': ['Information based on current reports and may be subject to change.'],
-            'policy_checklist': {
-                'copyright_risk': False,
-                'medical_or_financial_claims': False,
-                'nsfw': False,
-                'shocking_or_graphic': False
-            }
+            'policy_checklist': dict(DEFAULT_POLICY_CHECKLIST)
         }
         
     def _generate_explainer_script(self, post: Dict[str, Any], chapters: int, words_per: int) -> Dict[str, Any]:
         """Generate explainer-style script."""
         title = post.get('title', 'How It Works')
         
+        body = self._generate_chapter_content(post, words_per)
+        
         return {
             'version': 'script.v1',
             'title': title[:100],
@@ -211,8 +729,8 @@ class ScriptGenerator:
                 'chapters': [
                     {
                         'id': i + 1,
-                        'heading': ['The Basics', 'How It Works', 'Real-World Examples', 'Common Misconceptions', 'Key Takeaways'][i % 5],
-                        'body': self._generate_chapter_content(post, i, words_per)
+                        'heading': EXPLAINER_HEADINGS[i % 5],
+                        'body': body
                     }
                     for i in range(min(chapters, 5))
                 ],
@@ -221,39 +739,31 @@ class ScriptGenerator:
                         "Subscribe for more explainers, and check out our other videos. "
                         "Thanks for learning with us today!"
             },
-            'broll_keywords': ['education', 'learning', 'explanation', 'diagram', 'concept'],
+            'broll_keywords': list(EXPLAINER_BROLL),
             'disclaimers': [],
-            'policy_checklist': {
-                'copyright_risk': False,
-                'medical_or_financial_claims': False,
-                'nsfw': False,
-                'shocking_or_graphic': False
-            }
+            'policy_checklist': dict(DEFAULT_POLICY_CHECKLIST)
         }
         
-    def _generate_chapter_content(self, post: Dict[str, Any], chapter_index: int, target_words: int) -> str:
-        """Generate content for a single chapter."""
+    def _generate_chapter_content(self, post: Dict[str, Any], target_words: int) -> str:
+        """Generate chapter content.
+        
+        The body depends only on the post and word target, so the template
+        generators build it once and share it across chapters.
+        """
         selftext = post.get('selftext', '')
         sentences = selftext.split('.')[:3]  # Use first 3 sentences as base
-        
-        base_content = '. '.join(sentences) if sentences else f"This is fascinating point number {chapter_index + 1}."
+        base_content = '. '.join(sentences)
         
         # Pad to target word count
-        current_words = len(base_content.split())
-        if current_words < target_words:
-            padding = [
-                "This is particularly interesting when you consider the broader implications.",
-                "Experts in the field have noted the significance of this development.",
-                "The data shows a clear trend that supports this conclusion.",
-                "Many people don't realize how important this actually is.",
-                "Let's take a moment to understand what this really means.",
-            ]
+        parts = [base_content]
+        current_words = _count_words(base_content)
+        for sentence in CHAPTER_PADDING:
+            if current_words >= target_words:
+                break
+            parts.append(sentence)
+            current_words += _count_words(sentence)
             
-            while current_words < target_words and padding:
-                base_content += " " + padding.pop(0)
-                current_words = len(base_content.split())
-                
-        return base_content[:target_words * 6]  # Rough char limit
+        return ' '.join(parts)[:target_words * 6]  # Rough char limit
         
     def _generate_with_llm(self, 
                           post: Dict[str, Any], 
@@ -268,11 +778,241 @@ class ScriptGenerator:
             
         Returns:
             Script dictionary
+            
+        Raises:
+            CopyrightRiskError: If the LLM flags the script as a copyright risk
+        """
+        cache_key = self._llm_cache_key(post, topic_config, target_words)
+        script = self._get_cached_llm_script(cache_key)
+        if script is not None:
+            return script
+            
+        script, embedding = self._check_semantic_cache([post], [topic_config], target_words)[0]
+        if script is not None:
+            return script
+            
+        try:
+            body = self._llm_request_body(post, topic_config, target_words)
+            stream = self.client.chat.completions.create(
+                **body,
+                stream=True,
+                stream_options={'include_usage': True}
+            )
+            parts = []
+            tail = ''
+            try:
+                for chunk in stream:
+                    if chunk.usage:
+                        self._log_usage(chunk.usage.completion_tokens, body['max_tokens'])
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        tail = _scan_stream_delta(tail, delta)
+                        parts.append(delta)
+            finally:
+                # Stops generation early when the scan raises
+                stream.close()
+                
+            script = self._parse_llm_script(''.join(parts))
+            self._store_semantic_cache(embedding, script, post, topic_config, target_words)
+            self._put_cached_llm_script(cache_key, script)
+            return script
+            
+        except CopyrightRiskError:
+            # The template would paste the source post in; skip it instead
+            raise
+        except Exception as e:
+            self.logger.error(f"LLM generation failed: {e}")
+            # Fallback to template generation
+            return self._generate_from_template(post, topic_config, target_words)
+            
+    def _update_rate_limits(self, headers):
+        """Adopt the account limits reported in OpenAI response headers.
+        
+        Args:
+            headers: Response headers
+        """
+        try:
+            requests_per_minute = float(headers.get('x-ratelimit-limit-requests', 0))
+            tokens_per_minute = float(headers.get('x-ratelimit-limit-tokens', 0))
+        except ValueError:
+            return
+        self.rate_limiter.update_limits(requests_per_minute, tokens_per_minute)
+        
+    async def _read_event_stream(self, response: aiohttp.ClientResponse, max_tokens: int) -> str:
+        """Collect the message content of a streamed chat completion.
+        
+        Args:
+            response: Server-sent events response
+            max_tokens: Completion budget of the request, for usage logging
+            
+        Returns:
+            Message content of the first choice
+        """
+        parts = []
+        tail = ''
+        async for line in response.content:
+            if not line.startswith(b'data: '):
+                continue
+            payload = line[6:].strip()
+            if payload == b'[DONE]':
+                break
+            event = loads_json(payload)
+            if event.get('usage'):
+                self._log_usage(event['usage'].get('completion_tokens', 0), max_tokens)
+            choices = event.get('choices')
+            delta = choices[0].get('delta', {}).get('content') if choices else None
+            if delta:
+                tail = _scan_stream_delta(tail, delta)
+                parts.append(delta)
+        return ''.join(parts)
+        
+    def _llm_cache_key(self,
+                       post: Dict[str, Any],
+                       topic_config: Dict[str, Any],
+                       target_words: int) -> str:
+        """Hash the parts of an LLM request that determine the script.
+        
+        Cross-posts share title and selftext but not URL or subreddit, so
+        those are left out of the key.
+        
+        Args:
+            post: Reddit post data
+            topic_config: Topic configuration
+            target_words: Target word count
+            
+        Returns:
+            Hex digest identifying the request
         """
-        # Load system prompt from Claude.md
-        system_prompt = self._get_system_prompt()
+        key = dumps_json({
+            **self._request_params(topic_config, target_words),
+            'title': post.get('title', ''),
+            'selftext': post.get('selftext', '')[:2000]
+        }, indent=False)
+        return hashlib.sha256(key).hexdigest()
+        
+    def _request_params(self, topic_config: Dict[str, Any], target_words: int) -> Dict[str, Any]:
+        """Get the request parameters, besides the post, that shape a script.
+        
+        Both the exact-match and the semantic cache only reuse scripts
+        generated with the same parameters.
         
-        # Prepare input for LLM
+        Args:
+            topic_config: Topic configuration
+            target_words: Target word count
+            
+        Returns:
+            Prompt version, model, topic, style notes and target length
+        """
+        return {
+            'prompt': SYSTEM_PROMPT_HASH,
+            'model': self.model,
+            'topic_id': topic_config.get('topic_id'),
+            'style': topic_config.get('style', ''),
+            'target_words': target_words
+        }
+        
+    def _get_cached_llm_script(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the script generated for an identical request.
+        
+        Args:
+            key: Request hash from _llm_cache_key
+            
+        Returns:
+            Script dictionary, or None if not cached
+        """
+        script = self._llm_cache.get(key)
+        if script is None:
+            return None
+        self._llm_cache.move_to_end(key)
+        self.logger.info("Reusing script generated for an identical LLM request")
+        return copy.deepcopy(script)
+        
+    def _put_cached_llm_script(self, key: str, script: Dict[str, Any]):
+        """Remember an LLM-generated script for identical requests.
+        
+        Args:
+            key: Request hash from _llm_cache_key
+            script: Generated script (before finalization)
+        """
+        self._llm_cache[key] = copy.deepcopy(script)
+        self._llm_cache.move_to_end(key)
+        if len(self._llm_cache) > LLM_CACHE_SIZE:
+            self._llm_cache.popitem(last=False)
+            
+    def _check_semantic_cache(self,
+                              posts: List[Dict[str, Any]],
+                              topic_configs: List[Dict[str, Any]],
+                              target_words: int) -> List[Tuple[Optional[Dict[str, Any]], Optional[List[float]]]]:
+        """Look up scripts of near-duplicate posts in the semantic cache.
+        
+        Only scripts generated with the same request parameters are reused.
+        
+        Args:
+            posts: Reddit post data
+            topic_configs: Topic configuration for each post
+            target_words: Target word count
+            
+        Returns:
+            (cached script or None, post embedding or None) for each post
+        """
+        if self.semantic_cache is None or not posts:
+            return [(None, None)] * len(posts)
+            
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding_model,
+                input=[f"{post.get('title', '')}\n{post.get('selftext', '')[:500]}" for post in posts]
+            )
+            embeddings = [item.embedding for item in response.data]
+        except Exception as e:
+            self.logger.warning(f"Semantic cache lookup failed: {e}")
+            return [(None, None)] * len(posts)
+            
+        results = []
+        for post, topic_config, embedding in zip(posts, topic_configs, embeddings):
+            hit = self.semantic_cache.lookup(embedding, self._request_params(topic_config, target_words))
+            if hit:
+                self.logger.info(f"Reusing script of post {hit['post_id']} for post {post.get('id', 'unknown')} "
+                                 f"(similarity {hit['similarity']:.3f})")
+                results.append((hit['script'], embedding))
+            else:
+                results.append((None, embedding))
+        return results
+        
+    def _store_semantic_cache(self,
+                              embedding: Optional[List[float]],
+                              script: Dict[str, Any],
+                              post: Dict[str, Any],
+                              topic_config: Dict[str, Any],
+                              target_words: int):
+        """Remember an LLM-generated script for future near-duplicate posts.
+        
+        Args:
+            embedding: Post embedding from _check_semantic_cache
+            script: Generated script
+            post: Reddit post data
+            topic_config: Topic configuration
+            target_words: Target word count
+        """
+        if self.semantic_cache is not None and embedding is not None:
+            self.semantic_cache.add(embedding, script, post.get('id', 'unknown'),
+                                    self._request_params(topic_config, target_words))
+            
+    def _llm_request_body(self,
+                          post: Dict[str, Any],
+                          topic_config: Dict[str, Any],
+                          target_words: int) -> Dict[str, Any]:
+        """Build the chat completion request for a post.
+        
+        Args:
+            post: Reddit post data
+            topic_config: Topic configuration
+            target_words: Target word count
+            
+        Returns:
+            Keyword arguments for ``chat.completions.create``
+        """
+        # Only per-post data goes in the user message; the shared prefix stays first
         llm_input = {
             'topic_id': topic_config.get('topic_id'),
             'target_minutes': target_words // 165,
@@ -282,60 +1022,109 @@ class ScriptGenerator:
                 'url': post.get('url', ''),
                 'subreddit': post.get('subreddit', ''),
                 'captured_at': post.get('captured_at', datetime.now().isoformat())
-            },
-            'brand': {
-                'channel_name': 'AI Slop Channel',
-                'style_notes': topic_config.get('style', ''),
-                'banned_terms': self.config.get('content_policy.banned_terms', []),
-                'voice_name': 'Rachel'
-            },
-            'output_format': 'script.v1'
+            }
         }
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": json.dumps(llm_input)}
-                ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"}
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": self._system_message(topic_config.get('style', ''))},
+                {"role": "user", "content": dumps_json(llm_input, indent=False).decode('utf-8')}
+            ],
+            'temperature': self.temperature,
+            'top_p': self.top_p,
+            'max_tokens': self._completion_budget(target_words),
+            'response_format': {"type": "json_object"}
+        }
+        
+    def _system_message(self, style_notes: str) -> str:
+        """Build the system message shared by every post in a run.
+        
+        Providers cache repeated prompt prefixes, so the prompt, schema and
+        brand block come first and the per-topic style notes come last.
+        
+        Args:
+            style_notes: Topic style notes
+            
+        Returns:
+            System message content
+        """
+        message = self._system_messages.get(style_notes)
+        if message is None:
+            brand = {
+                'channel_name': 'AI Slop Channel',
+                'voice_name': 'Rachel',
+                'banned_terms': self.config.get('content_policy.banned_terms', []),
+                'output_format': 'script.v1'
+            }
+            # Load system prompt from Claude.md
+            message = (
+                f"{self._get_system_prompt()}\n\n{SCRIPT_SCHEMA_SPEC}\n\n"
+                f"BRAND:\n{dumps_json(brand, indent=False).decode('utf-8')}\n\nSTYLE NOTES:\n{style_notes}"
             )
+            self._system_messages[style_notes] = message
+        return message
+        
+    def _completion_budget(self, target_words: int) -> int:
+        """Size max_tokens to the script length instead of a fixed ceiling.
+        
+        Reserving less than the ceiling keeps requests light on the TPM budget.
+        
+        Args:
+            target_words: Target word count
             
-            # Parse response
-            script = json.loads(response.choices[0].message.content)
+        Returns:
+            max_tokens for the request, capped at llm.max_tokens
+        """
+        return min(self.max_tokens, int(target_words * TOKENS_PER_WORD) + SCRIPT_OVERHEAD_TOKENS)
+        
+    def _log_usage(self, completion_tokens: int, max_tokens: int):
+        """Log completion token usage against the budget, to tune TOKENS_PER_WORD.
+        
+        Args:
+            completion_tokens: Tokens the completion used
+            max_tokens: Budget the request reserved
+        """
+        self.logger.debug(f"LLM completion used {completion_tokens}/{max_tokens} tokens")
+        
+    def _parse_llm_script(self, content: str) -> Dict[str, Any]:
+        """Parse an LLM response into a script.
+        
+        Args:
+            content: Message content returned by the LLM
             
-            # Validate it matches our schema
-            if script.get('version') != 'script.v1':
-                raise ValueError("Invalid script version")
-                
-            return script
+        Returns:
+            Script dictionary
             
-        except Exception as e:
-            self.logger.error(f"LLM generation failed: {e}")
-            # Fallback to template generation
-            return self._generate_from_template(post, topic_config, target_words)
+        Raises:
+            ValueError: If the content is not a script.v1 JSON object
+            CopyrightRiskError: If the script is flagged as a copyright risk
+        """
+        script = loads_json(content)
+        
+        # Validate it matches our schema
+        if not isinstance(script, dict) or script.get('version') != 'script.v1':
+            raise ValueError("Invalid script version")
+            
+        if (script.get('policy_checklist') or {}).get('copyright_risk'):
+            raise CopyrightRiskError("LLM flagged the script as a copyright risk")
             
+        return script
+        
     def _get_system_prompt(self) -> str:
         """Get system prompt for LLM."""
-        # This would normally load from Claude.md, but we'll use a simplified version
-        return """You are a YouTube script generator for a faceless channel. 
-        Generate scripts that are engaging, informative, and YouTube-friendly.
-        Output must be valid JSON matching the script.v1 schema.
-        Keep content PG-13, avoid copyright issues, and optimize for retention.
-        Target the specified duration precisely. Return ONLY valid JSON."""
-        
-    def _validate_script(self, script: Dict[str, Any]) -> Dict[str, Any]:
+        return SYSTEM_PROMPT
+        
+    def _validate_script(self, script: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
         """Validate and fix script structure.
         
+        Spoken words are counted in the same walk over the narration.
+        
         Args:
             script: Script dictionary
             
         Returns:
-            Validated script dictionary
+            Tuple of (validated script dictionary, spoken word count)
         """
         # Ensure required fields
         required = ['version', 'title', 'hook', 'narration', 'broll_keywords', 'disclaimers', 'policy_checklist']
@@ -348,26 +1137,56 @@ class ScriptGenerator:
                 elif field == 'broll_keywords':
                     script['broll_keywords'] = ['general', 'content']
                 elif field == 'policy_checklist':
-                    script['policy_checklist'] = {
-                        'copyright_risk': False,
-                        'medical_or_financial_claims': False,
-                        'nsfw': False,
-                        'shocking_or_graphic': False
-                    }
+                    script['policy_checklist'] = dict(DEFAULT_POLICY_CHECKLIST)
                     
-        # Validate narration structure
+        # Validate narration structure and count its words
+        word_count = _count_words(script.get('hook', ''))
         if 'narration' in script:
-            if 'chapters' not in script['narration']:
-                script['narration']['chapters'] = []
-            if 'intro' not in script['narration']:
-                script['narration']['intro'] = "Welcome to our video!"
-            if 'outro' not in script['narration']:
-                script['narration']['outro'] = "Thanks for watching!"
+            narration = script['narration']
+            if 'chapters' not in narration:
+                narration['chapters'] = []
+            if 'intro' not in narration:
+                narration['intro'] = "Welcome to our video!"
+            if 'outro' not in narration:
+                narration['outro'] = "Thanks for watching!"
+            word_count += _count_words(narration['intro']) + _count_words(narration['outro'])
+            for chapter in narration['chapters']:
+                word_count += _count_words(chapter.get('body', ''))
                 
         # Ensure title length
         if 'title' in script:
             script['title'] = script['title'][:100]
             
+        return script, word_count
+        
+    def _finalize_script(self,
+                         script: Dict[str, Any],
+                         post: Dict[str, Any],
+                         target_minutes: int,
+                         generated_at: Optional[str] = None) -> Dict[str, Any]:
+        """Validate a generated script and add its metadata.
+        
+        Args:
+            script: Script dictionary
+            post: Reddit post data
+            target_minutes: Target video duration
+            generated_at: ISO timestamp of the generation run (defaults to now)
+            
+        Returns:
+            Finalized script dictionary
+        """
+        # Validate and adjust script
+        script, word_count = self._validate_script(script)
+        
+        # Add metadata
+        script['generated_at'] = generated_at or datetime.now().isoformat()
+        script['post_id'] = post.get('id', 'unknown')
+        script['target_minutes'] = target_minutes
+        
+        # 165 wpm average, as in calculate_duration
+        self.logger.info(f"Estimated duration: {round(word_count / 165, 1)} minutes "
+                         f"(target {target_minutes})")
+        
         return script
         
     def save_script(self, script: Dict[str, Any], output_dir: Path) -> Path:
@@ -382,12 +1201,16 @@ class ScriptGenerator:
         """
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Name the file after the generation time so it matches the metadata
+        try:
+            generated = datetime.fromisoformat(script['generated_at'])
+        except (KeyError, TypeError, ValueError):
+            generated = datetime.now()
+        timestamp = generated.strftime('%Y%m%d_%H%M%S')
         filename = f"script_{script.get('post_id', 'unknown')}_{timestamp}.json"
         filepath = output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(script, f, indent=2, ensure_ascii=False)
+        dump_json(script, filepath)
             
         self.logger.info(f"Saved script to {filepath}")
         return filepath
@@ -401,28 +1224,60 @@ class ScriptGenerator:
         Returns:
             Duration in minutes
         """
-        total_words = 0
+        total_words = sum(_count_words(text) for text in self._spoken_texts(script))
         
-        # Count words in narration
-        narration = script.get('narration', {})
+        # Calculate duration (165 wpm average)
+        duration_minutes = total_words / 165
         
-        # Hook
-        total_words += len(script.get('hook', '').split())
+        return round(duration_minutes, 1)
         
-        # Intro
-        total_words += len(narration.get('intro', '').split())
+    def calculate_durations(self, scripts: List[Dict[str, Any]]) -> np.ndarray:
+        """Calculate estimated durations of many scripts in one pass.
         
-        # Chapters
-        for chapter in narration.get('chapters', []):
-            total_words += len(chapter.get('body', '').split())
+        All spoken text is encoded into one byte buffer, one record per
+        script, and word starts are counted with vectorized NumPy operations
+        instead of a str.split per text field. Only ASCII whitespace
+        separates words here.
+        
+        Args:
+            scripts: Script dictionaries
             
-        # Outro
-        total_words += len(narration.get('outro', '').split())
+        Returns:
+            Durations in minutes, one per script
+        """
+        if not scripts:
+            return np.zeros(0)
+            
+        # Record separator (0x1E) marks script boundaries and counts as whitespace
+        records = (' '.join(self._spoken_texts(script)).replace('\x1e', ' ') for script in scripts)
+        buf = np.frombuffer('\x1e'.join(records).encode('utf-8'), dtype=np.uint8)
         
-        # Calculate duration (165 wpm average)
-        duration_minutes = total_words / 165
+        in_word = ~WHITESPACE_BYTES[buf]
+        word_starts = in_word.copy()
+        word_starts[1:] &= ~in_word[:-1]
+        record = np.cumsum(buf == 0x1E)
+        word_counts = np.bincount(record[word_starts], minlength=len(scripts))
         
-        return round(duration_minutes, 1)
+        # 165 wpm average, as in calculate_duration
+        return np.round(word_counts / 165, 1)
+        
+    @staticmethod
+    def _spoken_texts(script: Dict[str, Any]) -> List[str]:
+        """Collect the narrated text fields of a script in reading order.
+        
+        Args:
+            script: Script dictionary
+            
+        Returns:
+            Hook, intro, chapter bodies and outro
+        """
+        narration = script.get('narration', {})
+        return [
+            script.get('hook', ''),
+            narration.get('intro', ''),
+            *(chapter.get('body', '') for chapter in narration.get('chapters', [])),
+            narration.get('outro', '')
+        ]
     
     def generate_script_manual(self, post: Dict[str, Any], topic_config: Dict[str, Any], 
                                script_json: Dict[str, Any]) -> Dict[str, Any]:
@@ -449,12 +1304,7 @@ class ScriptGenerator:
             script['disclaimers'] = []
         
         if 'policy_checklist' not in script:
-            script['policy_checklist'] = {
-                'copyright_risk': False,
-                'medical_or_financial_claims': False,
-                'nsfw': False,
-                'shocking_or_graphic': False
-            }
+            script['policy_checklist'] = dict(DEFAULT_POLICY_CHECKLIST)
         
         # Add default broll_keywords if missing
         if 'broll_keywords' not in script:
@@ -1,15 +1,69 @@
 """Thumbnail generation module for YouTube videos."""
 
 import json
-import random
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import textwrap
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
+from ..utils.fonts import find_font, load_font, wrap_text
+
+
+# Bold fonts to try, in order of preference
+FONT_PATHS = (
+    "C:/Windows/Fonts/arialbd.ttf",  # Arial Bold on Windows
+    "C:/Windows/Fonts/Arial.ttf",     # Regular Arial
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",  # Linux
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+)
+
+# Background photos are darkened to 60% (same as blending 40% black),
+# applied per channel with Image.point instead of a full-frame black overlay
+DARKEN_LUT = [int(v * 0.6) for v in range(256)] * 3
+
+
+@lru_cache(maxsize=8)
+def _decoration_mask(width: int, height: int) -> Image.Image:
+    """Build the corner accent and border mask for a thumbnail size.
+    
+    The shapes depend only on the size, so they are drawn once and pasted
+    in the topic's accent color on every thumbnail.
+    
+    Args:
+        width: Thumbnail width
+        height: Thumbnail height
+        
+    Returns:
+        'L' mask, 255 where decorations are drawn
+    """
+    mask = Image.new('L', (width, height), 0)
+    draw = ImageDraw.Draw(mask)
+    
+    # Top-left corner
+    draw.rectangle([(0, 0), (100, 10)], fill=255)
+    draw.rectangle([(0, 0), (10, 100)], fill=255)
+    
+    # Bottom-right corner
+    draw.rectangle([(width - 100, height - 10), 
+                   (width, height)], fill=255)
+    draw.rectangle([(width - 10, height - 100), 
+                   (width, height)], fill=255)
+    
+    # Add subtle border
+    border_width = 5
+    draw.rectangle([(0, 0), (width - 1, border_width)], fill=255)
+    draw.rectangle([(0, height - border_width), 
+                   (width - 1, height - 1)], fill=255)
+    draw.rectangle([(0, 0), (border_width, height - 1)], fill=255)
+    draw.rectangle([(width - border_width, 0), 
+                   (width - 1, height - 1)], fill=255)
+    
+    return mask
 
 
 class ThumbnailGenerator:
@@ -30,6 +84,14 @@ class ThumbnailGenerator:
         self.background_color = self.thumb_config.get('background_color', '#1E1E1E')
         self.text_position = self.thumb_config.get('text_position', 'center')
         self.max_words = self.thumb_config.get('max_words', 5)
+        self.jpeg_quality = self.thumb_config.get('jpeg_quality', 90)
+        
+        # Resolve the font once; faces are cached per size
+        self._font_path = find_font(FONT_PATHS)
+        
+        # Parse colors once
+        self._text_rgb = self._hex_to_rgb(self.text_color)
+        self._bg_rgb = self._hex_to_rgb(self.background_color)
         
     def generate_thumbnail(self,
                          script: Dict[str, Any],
@@ -69,8 +131,9 @@ class ThumbnailGenerator:
         filename = f"thumbnail_{script.get('post_id', 'unknown')}_{timestamp}.jpg"
         filepath = output_dir / filename
         
-        # Save with optimization
-        img.save(filepath, 'JPEG', quality=95, optimize=True)
+        # Single-pass baseline encode; YouTube re-encodes thumbnails anyway
+        img.save(filepath, 'JPEG', quality=self.jpeg_quality, optimize=False,
+                 progressive=False, subsampling=2)
         
         self.logger.info(f"Generated thumbnail: {filepath}")
         
@@ -127,36 +190,25 @@ class ThumbnailGenerator:
         Returns:
             Background image
         """
-        img = Image.new('RGB', (self.width, self.height))
-        draw = ImageDraw.Draw(img)
-        
         # Create gradient
-        base_color = self._hex_to_rgb(self.background_color)
+        base_color = np.array(self._bg_rgb, dtype=np.float64)
         
         # Darker version for gradient
-        dark_color = tuple(int(c * 0.6) for c in base_color)
-        
-        # Vertical gradient
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(dark_color[0] + (base_color[0] - dark_color[0]) * ratio)
-            g = int(dark_color[1] + (base_color[1] - dark_color[1]) * ratio)
-            b = int(dark_color[2] + (base_color[2] - dark_color[2]) * ratio)
-            draw.rectangle([(0, y), (self.width, y + 1)], fill=(r, g, b))
-            
-        # Add noise/texture
-        pixels = img.load()
-        for x in range(0, self.width, 3):
-            for y in range(0, self.height, 3):
-                noise = random.randint(-10, 10)
-                r, g, b = pixels[x, y]
-                pixels[x, y] = (
-                    max(0, min(255, r + noise)),
-                    max(0, min(255, g + noise)),
-                    max(0, min(255, b + noise))
-                )
-                
-        return img
+        dark_color = np.floor(base_color * 0.6)
+        
+        # Vertical gradient: one color per row, broadcast across the width
+        ratios = (np.arange(self.height) / self.height)[:, np.newaxis]
+        rows = (dark_color + (base_color - dark_color) * ratios).astype(np.uint8)
+        arr = np.repeat(rows[:, np.newaxis, :], self.width, axis=1)
+        
+        # Add noise/texture: every third pixel in each direction, same offset on all channels
+        speckles = arr[::3, ::3].astype(np.int16)
+        speckles += np.random.default_rng().integers(
+            -10, 11, size=speckles.shape[:2] + (1,), dtype=np.int16
+        )
+        arr[::3, ::3] = np.clip(speckles, 0, 255)
+        
+        return Image.fromarray(arr)
         
     def _create_from_background(self, background_path: Path) -> Image.Image:
         """Create thumbnail from background image.
@@ -169,19 +221,23 @@ class ThumbnailGenerator:
         """
         img = Image.open(background_path)
         
+        # Let the JPEG decoder scale by 1/2, 1/4 or 1/8 in the DCT domain
+        # while staying at or above the target size (no-op for other formats)
+        img.draft('RGB', (self.width, self.height))
+        
         # Resize to thumbnail dimensions
-        img = img.resize((self.width, self.height), Image.Resampling.LANCZOS)
+        img = img.resize((self.width, self.height), Image.Resampling.LANCZOS, reducing_gap=3.0)
         
         # Convert to RGB if necessary
         if img.mode != 'RGB':
             img = img.convert('RGB')
             
-        # Apply blur for text readability
-        img = img.filter(ImageFilter.GaussianBlur(radius=3))
+        # Apply blur for text readability (single-pass box blur; radius 5
+        # matches the spread of a sigma-3 Gaussian)
+        img = img.filter(ImageFilter.BoxBlur(5))
         
         # Darken the image
-        overlay = Image.new('RGB', (self.width, self.height), (0, 0, 0))
-        img = Image.blend(img, overlay, 0.4)
+        img = img.point(DARKEN_LUT)
         
         return img
         
@@ -197,49 +253,15 @@ class ThumbnailGenerator:
         """
         draw = ImageDraw.Draw(img)
         
-        # Try to use a bold font
-        try:
-            # Try common font paths
-            font_paths = [
-                "C:/Windows/Fonts/arialbd.ttf",  # Arial Bold on Windows
-                "C:/Windows/Fonts/Arial.ttf",     # Regular Arial
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",  # Linux
-                "/System/Library/Fonts/Helvetica.ttc",  # macOS
-            ]
-            
-            font = None
-            for font_path in font_paths:
-                if Path(font_path).exists():
-                    font = ImageFont.truetype(font_path, self.font_size)
-                    break
-                    
-            if not font:
-                # Fallback to default font
-                font = ImageFont.load_default()
-                
-        except:
+        # Use a bold font if one is installed
+        if self._font_path:
+            font = load_font(self._font_path, self.font_size)
+        else:
+            # Fallback to default font
             font = ImageFont.load_default()
             
         # Word wrap if needed
-        words = text.split()
-        lines = []
-        current_line = []
-        
-        for word in words:
-            current_line.append(word)
-            test_line = ' '.join(current_line)
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            if bbox[2] > self.width * 0.9:  # 90% of width
-                if len(current_line) > 1:
-                    current_line.pop()
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(test_line)
-                    current_line = []
-                    
-        if current_line:
-            lines.append(' '.join(current_line))
+        lines = wrap_text(text, font, self.width * 0.9)  # 90% of width
             
         # Calculate text position
         total_height = 0
@@ -259,7 +281,7 @@ class ThumbnailGenerator:
             y = self.height - total_height - self.height // 6
             
         # Draw text with shadow
-        text_color = self._hex_to_rgb(self.text_color)
+        text_color = self._text_rgb
         shadow_color = (0, 0, 0)
         
         for i, line in enumerate(lines):
@@ -267,15 +289,9 @@ class ThumbnailGenerator:
             line_width = bbox[2] - bbox[0]
             x = (self.width - line_width) // 2
             
-            # Draw shadow
-            for offset_x in range(-3, 4):
-                for offset_y in range(-3, 4):
-                    if offset_x != 0 or offset_y != 0:
-                        draw.text((x + offset_x, y + offset_y), line, 
-                                font=font, fill=shadow_color)
-                        
-            # Draw main text
-            draw.text((x, y), line, font=font, fill=text_color)
+            # Draw main text with a 3px shadow, rasterized once by FreeType's stroker
+            draw.text((x, y), line, font=font, fill=text_color,
+                     stroke_width=3, stroke_fill=shadow_color)
             
             y += bbox[3] - bbox[1] + 10
             
@@ -291,29 +307,9 @@ class ThumbnailGenerator:
         Returns:
             Decorated image
         """
-        draw = ImageDraw.Draw(img)
-        
-        # Add corner accents
+        # Add corner accents and border in one paste
         accent_color = self._get_accent_color(topic_id)
-        
-        # Top-left corner
-        draw.rectangle([(0, 0), (100, 10)], fill=accent_color)
-        draw.rectangle([(0, 0), (10, 100)], fill=accent_color)
-        
-        # Bottom-right corner
-        draw.rectangle([(self.width - 100, self.height - 10), 
-                       (self.width, self.height)], fill=accent_color)
-        draw.rectangle([(self.width - 10, self.height - 100), 
-                       (self.width, self.height)], fill=accent_color)
-        
-        # Add subtle border
-        border_width = 5
-        draw.rectangle([(0, 0), (self.width - 1, border_width)], fill=accent_color)
-        draw.rectangle([(0, self.height - border_width), 
-                       (self.width - 1, self.height - 1)], fill=accent_color)
-        draw.rectangle([(0, 0), (border_width, self.height - 1)], fill=accent_color)
-        draw.rectangle([(self.width - border_width, 0), 
-                       (self.width - 1, self.height - 1)], fill=accent_color)
+        img.paste(accent_color, mask=_decoration_mask(self.width, self.height))
         
         return img
         
@@ -382,8 +378,9 @@ class ThumbnailGenerator:
         """
         # Override background color if provided
         if background_color:
-            old_bg = self.background_color
+            old_bg, old_bg_rgb = self.background_color, self._bg_rgb
             self.background_color = f"#{background_color[0]:02x}{background_color[1]:02x}{background_color[2]:02x}"
+            self._bg_rgb = tuple(background_color)
         
         # Create minimal script and metadata
         script = {'title': text, 'post_id': job_id}
@@ -394,7 +391,7 @@ class ThumbnailGenerator:
         
         # Restore original background color
         if background_color:
-            self.background_color = old_bg
+            self.background_color, self._bg_rgb = old_bg, old_bg_rgb
             
         return thumbnail_path
 
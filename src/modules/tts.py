@@ -1,16 +1,34 @@
 """Text-to-Speech module for converting scripts to audio."""
 
 import json
+import subprocess
+import threading
 import time
+import uuid
 import wave
-import struct
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 from ..utils.config import get_config
+from ..utils.ffmpeg_utils import FFMPEG
 from ..utils.logger import get_logger
+from ..utils.tts_cache import TTSAudioCache, tts_cache_key, tts_normalized_key
+
+
+# Sine wavetable for mock audio; phases are table indexes wrapped with a mask
+WAVETABLE_SIZE = 1 << 14
+SINE_TABLE = np.sin(2 * np.pi * np.arange(WAVETABLE_SIZE) / WAVETABLE_SIZE)
+
+# File buffer for WAV output, so frame writes reach the OS in large blocks
+WAV_BUFFER_SIZE = 1 << 20
 
+# Longer texts are split at sentence boundaries and the chunks spoken in
+# parallel; kept under ElevenLabs' 5000-character request limit
+TTS_CHUNK_CHARS = 4500
 
 class TextToSpeech:
     """Converts text scripts to speech audio."""
@@ -30,6 +48,13 @@ class TextToSpeech:
         self.provider = self.tts_config.get('provider', 'elevenlabs')
         self.voice_id = self.tts_config.get('voice_id', 'rachel')
         self.output_format = self.tts_config.get('output_format', 'mp3')
+        self.cache_enabled = self.tts_config.get('cache_enabled', True)
+        self.cache_max_entries = self.tts_config.get('cache_max_entries', 500)
+        self.cache_ttl_days = self.tts_config.get('cache_ttl_days', 30)
+        
+        # Concurrent TTS requests allowed by the provider plan
+        self.max_concurrency = self.tts_config.get('max_concurrency', 4)
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrency)
         
         self.client = None
         if not dry_run and self.config.is_feature_enabled('tts'):
@@ -145,52 +170,68 @@ class TextToSpeech:
         duration = (word_count / 165) * 60  # seconds
         
         # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"audio_{post_id}_{timestamp}.wav"
-        audio_path = output_dir / filename
+        audio_path = output_dir / f"{self._audio_stem(post_id)}.wav"
         
         # Create a WAV file with generated tones to simulate speech
         sample_rate = 44100
         num_samples = int(sample_rate * duration)  # Full duration, no cap
         
-        # Generate a simple tone (440 Hz = A4 note) with variations
-        import math
-        samples = []
-        base_frequency = 440  # A4 note
-        
-        for i in range(num_samples):
-            # Create a varying tone to simulate speech rhythm
-            # Change frequency every 0.5 seconds
-            segment = int(i / (sample_rate * 0.5))
-            
-            # Vary frequency between 200-600 Hz to simulate speech
-            frequency = base_frequency + (segment % 10) * 40 - 200
-            
-            # Generate sine wave with varying amplitude
-            amplitude = 16000 * (0.5 + 0.5 * math.sin(i / sample_rate * 2))  # Volume modulation
-            t = i / sample_rate
-            
-            # Mix two frequencies for more natural sound
-            sample = int(amplitude * (
-                0.7 * math.sin(2 * math.pi * frequency * t) +
-                0.3 * math.sin(2 * math.pi * frequency * 1.5 * t)
-            ))
-            
-            # Clamp to 16-bit range
-            sample = max(-32767, min(32767, sample))
-            samples.append(struct.pack('<h', sample))
-            
-        # Write WAV file
-        with wave.open(str(audio_path), 'wb') as wav_file:
+        # Write WAV file. The frame count is declared up front so the header
+        # is written once with final sizes and never seeked back to and patched.
+        # Samples are synthesized one second at a time to keep memory flat
+        # regardless of script length
+        with open(audio_path, 'wb', buffering=WAV_BUFFER_SIZE) as f, wave.open(f, 'wb') as wav_file:
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(b''.join(samples))
+            wav_file.setnframes(num_samples)
+            for start in range(0, num_samples, sample_rate):
+                block = self._mock_audio_block(start, min(start + sample_rate, num_samples), sample_rate)
+                wav_file.writeframesraw(block.tobytes())
             
         self.logger.info(f"Generated mock audio: {word_count} words, {duration:.1f}s")
         
         return audio_path, duration
         
+    @staticmethod
+    def _mock_audio_block(start: int, stop: int, sample_rate: int) -> np.ndarray:
+        """Synthesize samples ``start``..``stop`` of the mock speech tone.
+        
+        Args:
+            start: Index of the first sample
+            stop: Index after the last sample
+            sample_rate: Sample rate in Hz
+            
+        Returns:
+            16-bit little-endian samples
+        """
+        # Generate a simple tone (440 Hz = A4 note) with variations
+        base_frequency = 440  # A4 note
+        i = np.arange(start, stop)
+        mask = WAVETABLE_SIZE - 1
+        
+        # Create a varying tone to simulate speech rhythm
+        # Change frequency every 0.5 seconds
+        segment = i // int(sample_rate * 0.5)
+        
+        # Vary frequency between 200-600 Hz to simulate speech
+        frequency = base_frequency + (segment % 10) * 40 - 200
+        
+        # Generate sine wave with varying amplitude
+        envelope = (i * (2 * WAVETABLE_SIZE / (2 * np.pi * sample_rate))).astype(np.int64)
+        amplitude = 16000 * (0.5 + 0.5 * SINE_TABLE[envelope & mask])  # Volume modulation
+        
+        # Mix two frequencies for more natural sound. Frequencies are whole Hz,
+        # so phase (cycles * table size) is exact in integer arithmetic
+        phase = frequency * i * WAVETABLE_SIZE
+        samples = np.trunc(amplitude * (
+            0.7 * SINE_TABLE[(phase // sample_rate) & mask] +
+            0.3 * SINE_TABLE[(3 * phase // (2 * sample_rate)) & mask]
+        ))
+        
+        # Clamp to 16-bit range
+        return np.clip(samples, -32767, 32767).astype('<i2')
+        
     def _generate_real_audio(self, 
                            text: str, 
                            output_dir: Path, 
@@ -209,17 +250,32 @@ class TextToSpeech:
         """
         if self.client and hasattr(self.client, 'generate_audio'):
             try:
-                # Generate timestamp for unique filename
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                output_path = output_dir / f"audio_{post_id}_{timestamp}"
+                output_path = output_dir / self._audio_stem(post_id)
+                model = "eleven_monolingual_v1"
+                
+                # Identical text and voice parameters produce the same audio;
+                # text differing only in whitespace or case reuses it as well
+                cache = None
+                if self.cache_enabled:
+                    cache = TTSAudioCache(output_dir.parent / 'tts_cache', self.cache_max_entries,
+                                          self.cache_ttl_days * 86400)
+                    cache_key = tts_cache_key(text, self.voice_id, model, voice_settings)
+                    normalized_key = tts_normalized_key(text, self.voice_id, model, voice_settings)
+                    cached = (cache.get(cache_key, output_path) or
+                              cache.get_normalized(normalized_key, output_path))
+                    if cached:
+                        self.logger.info(f"Reused cached TTS audio: {cached[0]}")
+                        return cached
                 
                 # Use the real ElevenLabs client
-                audio_path, duration = self.client.generate_audio(
-                    text=text,
-                    output_path=output_path,
-                    voice=self.voice_id,
-                    model="eleven_monolingual_v1"
-                )
+                chunks = self.split_text_for_api(text, TTS_CHUNK_CHARS)
+                if len(chunks) > 1:
+                    audio_path, duration = self._generate_chunked_audio(chunks, output_path, model)
+                else:
+                    audio_path, duration = self._request_audio(text, output_path, model)
+                
+                if cache is not None:
+                    cache.put(cache_key, audio_path, duration, normalized_key)
                 
                 self.logger.info(f"Generated REAL audio via ElevenLabs: {audio_path}")
                 return audio_path, duration
@@ -233,6 +289,72 @@ class TextToSpeech:
             self.logger.warning("No TTS client available, using mock audio")
             return self._generate_mock_audio(text, output_dir, post_id)
         
+    def _request_audio(self, text: str, output_path: Path, model: str) -> Tuple[Path, float]:
+        """Make one TTS API request, holding a concurrency slot.
+        
+        Args:
+            text: Text to convert
+            output_path: Output path without extension
+            model: TTS model ID
+            
+        Returns:
+            Tuple of (audio_path, duration)
+        """
+        with self._request_slots:
+            return self.client.generate_audio(
+                text=text,
+                output_path=output_path,
+                voice=self.voice_id,
+                model=model
+            )
+            
+    def _generate_chunked_audio(self, chunks: List[str], output_path: Path, model: str) -> Tuple[Path, float]:
+        """Speak text chunks concurrently and join them in order.
+        
+        Args:
+            chunks: Text chunks from split_text_for_api
+            output_path: Output path without extension
+            model: TTS model ID
+            
+        Returns:
+            Tuple of (audio_path, duration)
+        """
+        part_paths = [output_path.with_name(f"{output_path.name}_part{i:03d}") for i in range(len(chunks))]
+        
+        combined = None
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as executor:
+                results = list(executor.map(
+                    lambda args: self._request_audio(args[0], args[1], model),
+                    zip(chunks, part_paths)
+                ))
+                
+            parts = [audio_path for audio_path, _ in results]
+            combined = self.combine_audio_files(parts, output_path.with_suffix(parts[0].suffix))
+        finally:
+            # Remove the parts, including those left by a failed chunk
+            for part in output_path.parent.glob(f"{output_path.name}_part*"):
+                if part != combined:
+                    part.unlink(missing_ok=True)
+                    
+        self.logger.info(f"Generated audio from {len(chunks)} chunks in parallel")
+        return combined, sum(duration for _, duration in results)
+        
+    @staticmethod
+    def _audio_stem(post_id: str) -> str:
+        """Build a unique audio filename stem.
+        
+        Millisecond time plus a random suffix, so concurrent generations for
+        the same post never write to the same file.
+        
+        Args:
+            post_id: Post identifier
+            
+        Returns:
+            Filename without extension
+        """
+        return f"audio_{post_id}_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
+        
     def _save_audio_metadata(self, audio_path: Path, script: Dict[str, Any], duration: float):
         """Save audio metadata to JSON file.
         
@@ -319,18 +441,53 @@ class TextToSpeech:
     def combine_audio_files(self, audio_paths: List[Path], output_path: Path) -> Path:
         """Combine multiple audio files into one.
         
+        Files are joined with ffmpeg's concat demuxer and stream copy, so the
+        audio is never decoded or re-encoded; pydub is used when ffmpeg is not
+        available. Inputs must share codec and format parameters.
+        
         Args:
             audio_paths: List of audio file paths
             output_path: Output file path
             
         Returns:
             Combined audio file path
+            
+        Raises:
+            RuntimeError: If neither ffmpeg nor pydub can combine the files
         """
-        # This would use pydub or similar to combine audio files
-        # For now, just return the first file
-        if audio_paths:
+        if not audio_paths:
+            return output_path
+        if len(audio_paths) == 1:
             return audio_paths[0]
-        return output_path
+            
+        concat_file = output_path.with_name(output_path.name + '.concat.txt')
+        try:
+            with open(concat_file, 'w', encoding='utf-8') as f:
+                for path in audio_paths:
+                    # Concat list quoting: close the quote, escape it, reopen
+                    escaped = str(Path(path).absolute()).replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+                    
+            subprocess.run([
+                FFMPEG, '-hide_banner', '-loglevel', 'error', '-y',
+                '-f', 'concat', '-safe', '0', '-i', str(concat_file),
+                '-c', 'copy', str(output_path)
+            ], check=True, capture_output=True)
+            return output_path
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.logger.warning(f"ffmpeg concat failed, trying pydub: {e}")
+        finally:
+            concat_file.unlink(missing_ok=True)
+            
+        try:
+            from pydub import AudioSegment
+            combined = AudioSegment.empty()
+            for path in audio_paths:
+                combined += AudioSegment.from_file(str(path))
+            combined.export(str(output_path), format=output_path.suffix.lstrip('.') or 'wav')
+            return output_path
+        except Exception as e:
+            raise RuntimeError(f"Could not combine {len(audio_paths)} audio files: {e}") from e
 
 
 def main():
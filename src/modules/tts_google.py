@@ -8,9 +8,14 @@ from pathlib import Path
 from gtts import gTTS
 import pyttsx3
 import tempfile
+import time
+import uuid
 import wave
 import subprocess
 
+# Read buffer for WAV files, so header parsing doesn't issue tiny reads
+WAV_BUFFER_SIZE = 1 << 20
+
 class GoogleTTS:
     def __init__(self):
         """Initialize Google TTS - no API key required!"""
@@ -65,8 +70,9 @@ class GoogleTTS:
                 slow=settings["slow"]
             )
             
-            # Save to temporary MP3 file first
-            temp_mp3 = f"{output_path}_temp.mp3"
+            # Save to temporary MP3 file first; unique per call so concurrent
+            # requests for the same output path don't overwrite each other
+            temp_mp3 = f"{output_path}_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}_temp.mp3"
             tts.save(temp_mp3)
             print(f"Saved temporary MP3: {temp_mp3}")
             
@@ -75,7 +81,7 @@ class GoogleTTS:
             mp3_path = f"{output_path}.mp3"
             
             # Keep the MP3 and also create a WAV
-            os.rename(temp_mp3, mp3_path)
+            os.replace(temp_mp3, mp3_path)
             
             # Convert to WAV if ffmpeg is available
             try:
@@ -86,7 +92,7 @@ class GoogleTTS:
                 print(f"Converted to WAV: {wav_path}")
                 
                 # Get duration from WAV file
-                with wave.open(wav_path, 'r') as wav_file:
+                with open(wav_path, 'rb', buffering=WAV_BUFFER_SIZE) as f, wave.open(f, 'rb') as wav_file:
                     frames = wav_file.getnframes()
                     rate = wav_file.getframerate()
                     duration = frames / float(rate)
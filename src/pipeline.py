@@ -16,7 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.modules.ingest_reddit import RedditIngestor
 from src.modules.classify import TopicClassifier
-from src.modules.script_gen import ScriptGenerator
+from src.modules.script_gen import ScriptGenerator, CopyrightRiskError
 from src.modules.tts import TextToSpeech
 from src.modules.media_picker import MediaPicker
 from src.modules.thumbnail import ThumbnailGenerator
@@ -26,6 +26,10 @@ from src.utils.logger import get_logger, log_job_start, log_job_end, log_error
 from src.utils.dedup import DeduplicationManager
 
 
+class JobSkipped(Exception):
+    """The selected post can't be used; the job ends without a video."""
+
+
 class Pipeline:
     """Main orchestrator for the video generation pipeline."""
     
@@ -121,6 +125,11 @@ class Pipeline:
             self.state['status'] = 'completed'
             self.logger.info(f"Pipeline completed successfully: {self.job_id}")
             
+        except JobSkipped as e:
+            self.state['status'] = 'skipped'
+            self.state['skip_reason'] = str(e)
+            self.logger.warning(f"Pipeline skipped: {e}")
+            
         except Exception as e:
             self.state['status'] = 'failed'
             self.state['errors'].append(str(e))
@@ -157,6 +166,8 @@ class Pipeline:
             result = step_function()
             self.state['artifacts'][step_name] = result
             self.logger.info(f"Step completed: {step_name}")
+        except JobSkipped:
+            raise
         except Exception as e:
             self.logger.error(f"Step failed: {step_name} - {e}")
             raise
@@ -240,7 +251,12 @@ class Pipeline:
             # Generate script if none exists
             self.logger.info("No existing script found, generating new one")
             target_minutes = self.config.get('video.target_minutes', 10)
-            script = self.script_generator.generate_script(post, topic_config, target_minutes)
+            try:
+                script = self.script_generator.generate_script(post, topic_config, target_minutes)
+            except CopyrightRiskError as e:
+                # Don't pick the same post again on the next run
+                self.reddit_ingestor.mark_processed(post, {'skipped': 'copyright_risk'})
+                raise JobSkipped(f"Post {post.get('id', 'unknown')} skipped: {e}") from e
             
             # Save script
             script_file = self.script_generator.save_script(script, self.output_dir)
@@ -390,6 +406,9 @@ def main():
             for step, artifact in result['artifacts'].items():
                 print(f"  • {step}")
                 
+        elif result['status'] == 'skipped':
+            print(f"\nSkipped: {result.get('skip_reason', '')}")
+            
         else:
             print(f"\nErrors:")
             for error in result.get('errors', []):
@@ -2,11 +2,16 @@
 
 import json
 import hashlib
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Set, Dict, Any, Optional
 
 
+# Minimum seconds between expiry sweeps triggered by lookups
+CLEANUP_INTERVAL = 3600
+
+
 class DeduplicationManager:
     """Manages deduplication of processed content."""
     
@@ -30,6 +35,7 @@ class DeduplicationManager:
         
         # Initialize cache
         self.cache: Dict[str, Any] = {}
+        self._last_cleanup = time.monotonic()
         self._load_cache()
         
     def _load_cache(self):
@@ -65,6 +71,7 @@ class DeduplicationManager:
         if not self.enabled:
             return
             
+        self._last_cleanup = time.monotonic()
         cutoff_date = datetime.now() - timedelta(days=self.cache_days)
         cutoff_timestamp = cutoff_date.isoformat()
         
@@ -93,8 +100,8 @@ class DeduplicationManager:
         if not self.enabled:
             return False
             
-        # Clean expired items periodically
-        if len(self.cache) % 100 == 0:
+        # Clean expired items periodically; the sweep is O(n), so rate-limit it
+        if time.monotonic() - self._last_cleanup >= CLEANUP_INTERVAL:
             self._clean_expired()
             
         return item_id in self.cache
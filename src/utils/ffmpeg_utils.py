@@ -0,0 +1,146 @@
+"""Shared helpers for running ffmpeg and reading its output."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+from functools import lru_cache
+from typing import List, Optional
+
+
+# Resolve executables once at import; AI_SLOP_FFMPEG / AI_SLOP_FFPROBE override PATH
+FFMPEG = os.environ.get('AI_SLOP_FFMPEG') or shutil.which('ffmpeg') or 'ffmpeg'
+FFPROBE = os.environ.get('AI_SLOP_FFPROBE') or shutil.which('ffprobe') or 'ffprobe'
+
+# Hardware H.264 encoders in order of preference
+HW_H264_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox')
+
+
+def parse_progress_duration(stderr: Optional[str]) -> Optional[float]:
+    """Get the output duration reported by ffmpeg's ``-progress`` stream.
+
+    Args:
+        stderr: ffmpeg stderr captured from a run with ``-progress pipe:2``
+
+    Returns:
+        Output duration in seconds, or None if no progress line was found
+    """
+    if not stderr:
+        return None
+    for line in reversed(stderr.splitlines()):
+        if line.startswith('out_time_ms='):
+            try:
+                # Despite the name, ffmpeg reports out_time_ms in microseconds
+                return int(line.split('=', 1)[1]) / 1e6
+            except ValueError:
+                return None
+    return None
+
+
+@lru_cache(maxsize=None)
+def detect_h264_encoder() -> str:
+    """Find the best H.264 encoder that works on this machine.
+
+    Encoders listed by ``ffmpeg -encoders`` may still be unusable (e.g. NVENC
+    without an NVIDIA GPU), so each candidate must also encode one test frame.
+    The result is cached for the lifetime of the process.
+
+    Returns:
+        Encoder name, falling back to ``libx264``
+    """
+    try:
+        listing = subprocess.run(
+            [FFMPEG, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except (subprocess.SubprocessError, OSError):
+        return 'libx264'
+
+    for encoder in HW_H264_ENCODERS:
+        if f' {encoder} ' not in listing:
+            continue
+        test_cmd = [
+            FFMPEG, '-hide_banner', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+            '-frames:v', '1', '-c:v', encoder, '-f', 'null', '-'
+        ]
+        try:
+            if subprocess.run(test_cmd, capture_output=True, timeout=10).returncode == 0:
+                return encoder
+        except (subprocess.SubprocessError, OSError):
+            continue
+    return 'libx264'
+
+
+async def run_ffmpeg(cmd: List[str],
+                     timeout: Optional[float] = None,
+                     tail_bytes: int = 4096,
+                     quiet: bool = True) -> subprocess.CompletedProcess:
+    """Run an ffmpeg command without blocking the event loop.
+
+    Only the last ``tail_bytes`` of stderr are kept, so long encodes don't
+    buffer their whole log in memory. In quiet mode ffmpeg runs with
+    ``-hide_banner -loglevel error -nostats``; if it fails, the command is
+    re-run once with ``-loglevel warning`` so the returned stderr carries
+    useful diagnostics.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Timeout in seconds
+        tail_bytes: Number of stderr bytes to keep
+        quiet: Suppress banner, stats and non-error log output
+
+    Returns:
+        CompletedProcess with returncode and the stderr tail as text
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish in time
+    """
+    if not quiet:
+        return await _spawn(cmd, timeout, tail_bytes)
+
+    result = await _spawn(_with_loglevel(cmd, 'error'), timeout, tail_bytes)
+    if result.returncode != 0:
+        result = await _spawn(_with_loglevel(cmd, 'warning'), timeout, tail_bytes)
+    return result
+
+
+def _with_loglevel(cmd: List[str], level: str) -> List[str]:
+    """Insert quiet logging flags after the ffmpeg executable."""
+    return [cmd[0], '-hide_banner', '-loglevel', level, '-nostats', *cmd[1:]]
+
+
+async def _spawn(cmd: List[str],
+                 timeout: Optional[float],
+                 tail_bytes: int) -> subprocess.CompletedProcess:
+    """Spawn a process, keeping only the tail of its stderr."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    tail = bytearray()
+
+    async def _drain():
+        while True:
+            chunk = await proc.stderr.read(4096)
+            if not chunk:
+                break
+            tail.extend(chunk)
+            del tail[:-tail_bytes]
+        await proc.wait()
+
+    try:
+        await asyncio.wait_for(_drain(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout, stderr=_decode(tail))
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout=None, stderr=_decode(tail))
+
+
+def _decode(data: bytearray) -> str:
+    """Decode an stderr tail, normalizing ffmpeg's carriage returns."""
+    return data.decode('utf-8', errors='replace').replace('\r', '\n')
@@ -0,0 +1,91 @@
+"""Cached font loading and text wrapping for thumbnail rendering."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from PIL import ImageFont
+
+
+@lru_cache(maxsize=64)
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing the FreeType face across calls.
+
+    Args:
+        path: Font file path
+        size: Font size in pixels
+
+    Returns:
+        Loaded font
+
+    Raises:
+        OSError: If the font cannot be read
+    """
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=None)
+def _find_font(paths: Sequence[str]) -> Optional[str]:
+    """Cached lookup for find_font; ``paths`` must be hashable."""
+    for path in paths:
+        if not Path(path).exists():
+            continue
+        try:
+            load_font(path, 12)
+        except OSError:
+            continue
+        return path
+    return None
+
+
+def find_font(paths: Sequence[str]) -> Optional[str]:
+    """Find the first font in a list of candidates that exists and loads.
+
+    The result is cached per candidate list, so the filesystem is checked
+    once per process.
+
+    Args:
+        paths: Candidate font file paths in order of preference
+
+    Returns:
+        Font path, or None if no candidate is usable
+    """
+    return _find_font(tuple(paths))
+
+
+def wrap_text(text: str, font: ImageFont.ImageFont, max_width: float) -> List[str]:
+    """Greedily wrap words into lines no wider than ``max_width``.
+
+    Each word is measured once with ``getlength`` and line widths are
+    accumulated, instead of re-measuring every candidate line. A word wider
+    than ``max_width`` gets a line of its own.
+
+    Args:
+        text: Text to wrap
+        font: Font used to render the text
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Wrapped lines
+    """
+    space = font.getlength(' ')
+    lines = []
+    current_line: List[str] = []
+    line_width = 0.0
+
+    for word in text.split():
+        word_width = font.getlength(word)
+        width = line_width + space + word_width if current_line else word_width
+        if width <= max_width:
+            current_line.append(word)
+            line_width = width
+        elif current_line:
+            lines.append(' '.join(current_line))
+            current_line = [word]
+            line_width = word_width
+        else:
+            lines.append(word)
+
+    if current_line:
+        lines.append(' '.join(current_line))
+    return lines
@@ -0,0 +1,67 @@
+"""Fast JSON encoding, decoding and file output, using orjson when it is installed."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional - fall back to stdlib json
+    orjson = None
+
+
+def dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """Encode an object as UTF-8 JSON.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Indent with two spaces; otherwise emit compact JSON
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Decoded object
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(obj: Any, path: Union[str, Path]) -> None:
+    """Write an object to a file as indented UTF-8 JSON.
+
+    The file is written under a temporary name and then renamed into place,
+    so readers never see a partially written file.
+
+    Args:
+        obj: JSON-serializable object
+        path: Output file path
+    """
+    path = Path(path)
+    data = dumps_json(obj)
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
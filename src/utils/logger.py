@@ -189,7 +189,7 @@ def log_job_end(job_id: str, status: str, duration: float, extra: Optional[Dict[
     
     Args:
         job_id: Job identifier
-        status: Job status (success, failed, error)
+        status: Job status (success, failed, skipped, error)
         duration: Job duration in seconds
         extra: Extra data to log
     """
@@ -0,0 +1,172 @@
+"""Read media durations straight from container headers.
+
+Parsing the header of an MP4/M4A, WAV or MP3 file takes a few small reads,
+whereas ffprobe costs a full process spawn. Callers should fall back to
+ffprobe when ``read_duration`` returns None.
+"""
+
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+
+# MPEG audio lookup tables (Layer III)
+_MP3_BITRATES = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {
+    1: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    2.5: [11025, 12000, 8000],
+}
+
+# In-process cache keyed by (path, mtime_ns, size)
+_duration_cache: Dict[Tuple[str, int, int], Optional[float]] = {}
+
+
+def read_duration(media_path: Union[str, Path]) -> Optional[float]:
+    """Get the duration of an MP4/M4A, WAV or MP3 file from its header.
+
+    Args:
+        media_path: Path to media file
+
+    Returns:
+        Duration in seconds, or None if the format is not recognized
+    """
+    path = Path(media_path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = (str(path.absolute()), stat.st_mtime_ns, stat.st_size)
+    if key in _duration_cache:
+        return _duration_cache[key]
+
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(12)
+            if len(head) < 12:
+                duration = None
+            elif head[4:8] == b'ftyp':
+                duration = _mp4_duration(f, stat.st_size)
+            elif head[:4] == b'RIFF' and head[8:12] == b'WAVE':
+                duration = _wav_duration(f, stat.st_size)
+            elif head[:3] == b'ID3' or (head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+                duration = _mp3_duration(f, head, stat.st_size)
+            else:
+                duration = None
+    except (OSError, struct.error, IndexError):
+        duration = None
+
+    if duration is not None and duration <= 0:
+        duration = None
+    _duration_cache[key] = duration
+    return duration
+
+
+def _mp4_duration(f, file_size: int) -> Optional[float]:
+    """Find moov/mvhd and read timescale and duration."""
+    moov = _find_atom(f, 0, file_size, b'moov')
+    if moov is None:
+        return None
+    mvhd = _find_atom(f, moov[0], moov[1], b'mvhd')
+    if mvhd is None:
+        return None
+
+    f.seek(mvhd[0])
+    version = f.read(4)[0]
+    if version == 1:
+        f.seek(16, 1)  # creation + modification time
+        timescale, duration = struct.unpack('>IQ', f.read(12))
+    else:
+        f.seek(8, 1)
+        timescale, duration = struct.unpack('>II', f.read(8))
+    return duration / timescale if timescale else None
+
+
+def _find_atom(f, start: int, end: int, atom_type: bytes) -> Optional[Tuple[int, int]]:
+    """Walk sibling atoms in [start, end) and return the payload range of one."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack('>I4s', f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return None
+        if kind == atom_type:
+            return pos + header, pos + size
+        pos += size
+    return None
+
+
+def _wav_duration(f, file_size: int) -> Optional[float]:
+    """Read byte rate from the fmt chunk and size from the data chunk."""
+    byte_rate = None
+    pos = 12
+    while pos + 8 <= file_size:
+        f.seek(pos)
+        chunk_id, size = struct.unpack('<4sI', f.read(8))
+        if chunk_id == b'fmt ':
+            byte_rate = struct.unpack('<HHII', f.read(12))[3]
+        elif chunk_id == b'data':
+            if not byte_rate:
+                return None
+            # Streaming writers may leave the size unset
+            if size == 0 or size == 0xFFFFFFFF or pos + 8 + size > file_size:
+                size = file_size - pos - 8
+            return size / byte_rate
+        pos += 8 + size + (size & 1)
+    return None
+
+
+def _mp3_duration(f, head: bytes, file_size: int) -> Optional[float]:
+    """Read the Xing/Info or VBRI frame count, else estimate from CBR bitrate."""
+    audio_start = 0
+    if head[:3] == b'ID3':
+        tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+        audio_start = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+
+    f.seek(audio_start)
+    buf = f.read(65536)
+    sync = next((i for i in range(len(buf) - 4)
+                 if buf[i] == 0xFF and buf[i + 1] & 0xE0 == 0xE0), None)
+    if sync is None:
+        return None
+
+    b1, b2, b3 = buf[sync + 1], buf[sync + 2], buf[sync + 3]
+    version = {3: 1, 2: 2, 0: 2.5}.get((b1 >> 3) & 0x03)
+    layer = (b1 >> 1) & 0x03
+    bitrate_idx = b2 >> 4
+    rate_idx = (b2 >> 2) & 0x03
+    mono = (b3 >> 6) == 3
+    if version is None or layer != 1 or rate_idx == 3:  # Layer III only
+        return None
+
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_idx]
+    samples_per_frame = 1152 if version == 1 else 576
+
+    # Xing/Info header sits after the side information
+    side_info = (17 if mono else 32) if version == 1 else (9 if mono else 17)
+    xing = sync + 4 + side_info
+    if buf[xing:xing + 4] in (b'Xing', b'Info'):
+        flags = struct.unpack('>I', buf[xing + 4:xing + 8])[0]
+        if flags & 0x01:
+            frames = struct.unpack('>I', buf[xing + 8:xing + 12])[0]
+            return frames * samples_per_frame / sample_rate
+
+    vbri = sync + 4 + 32
+    if buf[vbri:vbri + 4] == b'VBRI':
+        frames = struct.unpack('>I', buf[vbri + 14:vbri + 18])[0]
+        return frames * samples_per_frame / sample_rate
+
+    bitrate_kbps = _MP3_BITRATES[1 if version == 1 else 2][bitrate_idx]
+    if not bitrate_kbps:
+        return None
+    return (file_size - audio_start - sync) * 8 / (bitrate_kbps * 1000)
@@ -0,0 +1,132 @@
+"""Persistent on-disk cache for ffprobe metadata."""
+
+import json
+import sqlite3
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+from .ffmpeg_utils import FFPROBE
+
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'ai-slop' / 'probe.db'
+
+
+class ProbeCache:
+    """Caches ffprobe results keyed by (path, size, mtime_ns).
+
+    Clip libraries are re-probed on every assembly run; with the cache only
+    files that changed since the last run spawn an ffprobe process.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize probe cache.
+
+        Args:
+            db_path: Path to the sqlite database file
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_PATH
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS probe ('
+                'path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, json BLOB)'
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            # Cache is an optimization only - fall back to always probing
+            print(f"Warning: Could not open probe cache: {e}")
+            self._conn = None
+
+    def get_probe(self, media_path: Union[str, Path]) -> Dict[str, Any]:
+        """Get probe metadata for a media file, running ffprobe on a miss.
+
+        Args:
+            media_path: Path to audio/video file
+
+        Returns:
+            Dictionary with duration, width, height and codec (empty on failure)
+        """
+        path = Path(media_path).absolute()
+        try:
+            stat = path.stat()
+        except OSError:
+            return {}
+
+        key = str(path)
+        if self._conn is not None:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT size, mtime_ns, json FROM probe WHERE path = ?', (key,)
+                ).fetchone()
+            if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+                return json.loads(row[2])
+
+        info = self._run_ffprobe(path)
+        if info and self._conn is not None:
+            with self._lock:
+                try:
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO probe (path, size, mtime_ns, json) VALUES (?, ?, ?, ?)',
+                        (key, stat.st_size, stat.st_mtime_ns, json.dumps(info))
+                    )
+                    self._conn.commit()
+                except sqlite3.Error:
+                    pass
+        return info
+
+    def _run_ffprobe(self, path: Path) -> Dict[str, Any]:
+        """Run ffprobe and extract the cached fields.
+
+        Args:
+            path: Path to media file
+
+        Returns:
+            Probe metadata dictionary (empty on failure)
+        """
+        cmd = [
+            FFPROBE, '-v', 'error',
+            '-show_entries', 'format=duration:stream=codec_type,codec_name,width,height',
+            '-of', 'json',
+            str(path)
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            data = json.loads(result.stdout or '{}')
+        except (subprocess.SubprocessError, OSError, ValueError):
+            return {}
+
+        duration = data.get('format', {}).get('duration')
+        if duration is None:
+            return {}
+
+        streams = data.get('streams', [])
+        video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+        main = video or (streams[0] if streams else {})
+        return {
+            'duration': float(duration),
+            'width': video.get('width') if video else None,
+            'height': video.get('height') if video else None,
+            'codec': main.get('codec_name'),
+        }
+
+
+# Global probe cache instance
+_probe_cache = None
+
+
+def get_probe_cache() -> ProbeCache:
+    """Get the global probe cache instance.
+
+    Returns:
+        Probe cache instance
+    """
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = ProbeCache()
+    return _probe_cache
@@ -0,0 +1,98 @@
+"""Client-side request and token rate limiting for async API calls."""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Token buckets for requests per minute and tokens per minute.
+
+    Both buckets refill continuously. A request waits until it can take one
+    request slot and its estimated tokens, so concurrent callers stay under
+    the provider's limits instead of triggering 429 storms and backoff.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Request budget per minute
+            tokens_per_minute: Token budget per minute
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self, tokens: int = 0):
+        """Wait until one request and ``tokens`` tokens are available, then take them.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        # A request larger than the whole budget would otherwise wait forever
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._get_lock():
+            while True:
+                self._refill()
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0:
+                    if self._requests >= 1 and self._tokens >= tokens:
+                        self._requests -= 1
+                        self._tokens -= tokens
+                        return
+                    wait = max((1 - self._requests) * 60 / self.requests_per_minute,
+                               (tokens - self._tokens) * 60 / self.tokens_per_minute)
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold all requests for a while, e.g. after a 429 with Retry-After.
+
+        Args:
+            seconds: Pause duration
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def update_limits(self,
+                      requests_per_minute: Optional[float] = None,
+                      tokens_per_minute: Optional[float] = None):
+        """Adopt the limits reported by the provider.
+
+        Args:
+            requests_per_minute: Request budget per minute
+            tokens_per_minute: Token budget per minute
+        """
+        self._refill()
+        if requests_per_minute:
+            self.requests_per_minute = requests_per_minute
+            self._requests = min(self._requests, requests_per_minute)
+        if tokens_per_minute:
+            self.tokens_per_minute = tokens_per_minute
+            self._tokens = min(self._tokens, tokens_per_minute)
+
+    def _refill(self):
+        """Add the budget regenerated since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.requests_per_minute,
+                             self._requests + elapsed * self.requests_per_minute / 60)
+        self._tokens = min(self.tokens_per_minute,
+                           self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get a lock bound to the running event loop.
+
+        The limiter outlives individual ``asyncio.run`` calls, so the lock is
+        recreated when the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
@@ -0,0 +1,165 @@
+"""Embedding-keyed cache of generated scripts for near-duplicate posts."""
+
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class SemanticScriptCache:
+    """Returns a previously generated script when a post's embedding is close
+    enough to one seen before.
+
+    Reddit often surfaces the same story across subreddits with slightly
+    different titles. Embeddings are kept L2-normalized in one contiguous
+    float32 matrix, so a lookup is a single matrix-vector product. The matrix
+    is persisted as ``.npy`` with a JSONL sidecar holding the scripts.
+
+    Each entry also records the request parameters it was generated with
+    (prompt version, model, topic, style, length). A lookup only considers
+    entries with the same parameters, so a script is never reused for a
+    different kind of video about the same story.
+    """
+
+    def __init__(self, cache_dir: Path, threshold: float = 0.92, prompt_hash: Optional[str] = None):
+        """Initialize semantic script cache.
+
+        Args:
+            cache_dir: Directory for the cache files
+            threshold: Minimum cosine similarity for a hit
+            prompt_hash: Current system prompt version; entries generated with
+                another prompt are dropped on load
+        """
+        self.threshold = threshold
+        self.prompt_hash = prompt_hash
+        self.matrix_path = Path(cache_dir) / 'script_embeddings.npy'
+        self.entries_path = Path(cache_dir) / 'script_embeddings.jsonl'
+        self._matrix: Optional[np.ndarray] = None
+        self._entries: List[Dict[str, Any]] = []
+        # Matrix rows per request-parameter key
+        self._partitions: Dict[str, List[int]] = {}
+        self._load()
+
+    def _load(self):
+        """Load the embedding matrix and scripts from disk."""
+        if not self.matrix_path.exists() or not self.entries_path.exists():
+            return
+        try:
+            matrix = np.load(self.matrix_path)
+            with open(self.entries_path, 'r', encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError) as e:
+            # Cache is an optimization only - start empty
+            print(f"Warning: Could not load semantic script cache: {e}")
+            return
+
+        # A crash between the two writes can leave them out of step
+        count = min(len(matrix), len(entries))
+        keep = [i for i in range(count) if self._is_current(entries[i])]
+        self._matrix = np.ascontiguousarray(matrix[keep], dtype=np.float32)
+        self._entries = [entries[i] for i in keep]
+        for row, entry in enumerate(self._entries):
+            self._partitions.setdefault(self._params_key(entry['params']), []).append(row)
+
+        if len(keep) != len(entries) or len(matrix) != len(entries):
+            try:
+                self._save_all()
+            except OSError as e:
+                print(f"Warning: Could not save semantic script cache: {e}")
+
+    def lookup(self, embedding: List[float], params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Find the most similar cached script generated with the same parameters.
+
+        Args:
+            embedding: Embedding of the post's key text
+            params: Request parameters the script must have been generated with
+
+        Returns:
+            Cached entry with 'script', 'post_id' and 'similarity', or None
+        """
+        rows = self._partitions.get(self._params_key(params))
+        if self._matrix is None or not rows:
+            return None
+        query = self._normalize(embedding)
+        if query.shape[0] != self._matrix.shape[1]:
+            return None
+
+        similarities = self._matrix[rows] @ query
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        entry = self._entries[rows[best]]
+        return {
+            'post_id': entry['post_id'],
+            'script': copy.deepcopy(entry['script']),
+            'similarity': float(similarities[best])
+        }
+
+    def add(self, embedding: List[float], script: Dict[str, Any], post_id: str, params: Dict[str, Any]):
+        """Store a generated script under a post embedding.
+
+        Args:
+            embedding: Embedding of the post's key text
+            script: Generated script
+            post_id: Reddit post ID the script was generated for
+            params: Request parameters the script was generated with
+        """
+        row = self._normalize(embedding)[np.newaxis, :]
+        if self._matrix is None or self._matrix.shape[1] != row.shape[1]:
+            # First entry, or the embedding model changed
+            self._matrix = row
+            self._entries = []
+            self._partitions = {}
+            mode = 'w'
+        else:
+            self._matrix = np.vstack([self._matrix, row])
+            mode = 'a'
+        entry = {'post_id': post_id, 'params': params, 'script': copy.deepcopy(script)}
+        self._entries.append(entry)
+        self._partitions.setdefault(self._params_key(params), []).append(len(self._entries) - 1)
+
+        try:
+            self._save_matrix()
+            with open(self.entries_path, mode, encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except OSError as e:
+            print(f"Warning: Could not save semantic script cache: {e}")
+
+    def _is_current(self, entry: Dict[str, Any]) -> bool:
+        """Check that an entry has parameters and matches the current prompt."""
+        params = entry.get('params')
+        if not isinstance(params, dict):
+            return False
+        return self.prompt_hash is None or params.get('prompt') == self.prompt_hash
+
+    def _save_matrix(self):
+        """Atomically write the embedding matrix."""
+        self.matrix_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.matrix_path.with_name(self.matrix_path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, self._matrix)
+        os.replace(tmp, self.matrix_path)
+
+    def _save_all(self):
+        """Atomically rewrite the matrix and the scripts sidecar."""
+        self._save_matrix()
+        tmp = self.entries_path.with_name(self.entries_path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for entry in self._entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(tmp, self.entries_path)
+
+    @staticmethod
+    def _params_key(params: Dict[str, Any]) -> str:
+        """Canonical string for a set of request parameters."""
+        return json.dumps(params, sort_keys=True)
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
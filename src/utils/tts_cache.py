@@ -0,0 +1,199 @@
+"""Content-addressed on-disk cache of generated TTS audio."""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .json_io import dump_json, loads_json
+
+
+# Trailing punctuation dropped from normalized text
+TRAILING_PUNCTUATION = ' .,;:!?'
+
+
+def tts_cache_key(text: str,
+                  voice_id: str,
+                  model: str,
+                  voice_settings: Optional[Dict[str, Any]] = None) -> str:
+    """Hash the text and everything that affects how it is spoken.
+
+    Args:
+        text: Text sent to the TTS API
+        voice_id: Voice name or ID
+        model: TTS model ID
+        voice_settings: Voice settings sent with the request
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    params = json.dumps({'voice_id': voice_id, 'model': model, 'voice_settings': voice_settings},
+                        sort_keys=True)
+    return hashlib.sha256(params.encode('utf-8') + b'\0' + text.encode('utf-8')).hexdigest()
+
+
+def tts_normalized_key(text: str,
+                       voice_id: str,
+                       model: str,
+                       voice_settings: Optional[Dict[str, Any]] = None) -> str:
+    """Hash the text with whitespace, case and trailing punctuation normalized.
+
+    Script edits that only reflow lines or change capitalization produce the
+    same key, so their audio can be reused.
+
+    Args:
+        text: Text sent to the TTS API
+        voice_id: Voice name or ID
+        model: TTS model ID
+        voice_settings: Voice settings sent with the request
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    normalized = re.sub(r'\s+', ' ', text).strip().rstrip(TRAILING_PUNCTUATION).lower()
+    return tts_cache_key(normalized, voice_id, model, voice_settings)
+
+
+class TTSAudioCache:
+    """Serves previously generated audio for identical TTS requests.
+
+    TTS calls are the most expensive step of a run, and re-runs of the same
+    script otherwise pay for the same audio again. Each entry is the audio
+    file plus a JSON sidecar with its duration, stored under
+    ``<cache_dir>/<key[:2]>/``. Entries are evicted least recently used
+    first once the cache holds more than ``max_entries``.
+
+    A second tier maps normalized-text keys to exact keys in a sqlite index,
+    so near-identical text reuses audio too. Index rows expire after
+    ``ttl_seconds``.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = 500, ttl_seconds: float = 30 * 86400):
+        """Initialize TTS audio cache.
+
+        Args:
+            cache_dir: Directory for the cache files
+            max_entries: Maximum number of cached audio files
+            ttl_seconds: Lifetime of normalized-text index rows
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.index_path = self.cache_dir / 'index.db'
+
+    def get(self, key: str, output_path: Path) -> Optional[Tuple[Path, float]]:
+        """Place a cached audio file at ``output_path`` if there is one.
+
+        Args:
+            key: Cache key from tts_cache_key
+            output_path: Destination path; the cached file's suffix is applied
+
+        Returns:
+            Tuple of (audio_path, duration), or None on a miss
+        """
+        meta_path = self._meta_path(key)
+        try:
+            meta = loads_json(meta_path.read_bytes())
+            cached = meta_path.with_name(meta['file'])
+            audio_path = output_path.with_suffix(cached.suffix)
+            _link_or_copy(cached, audio_path)
+            # Mark as recently used
+            os.utime(cached)
+            os.utime(meta_path)
+            return audio_path, float(meta['duration'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def get_normalized(self, normalized_key: str, output_path: Path) -> Optional[Tuple[Path, float]]:
+        """Place cached audio for near-identical text at ``output_path``.
+
+        Args:
+            normalized_key: Cache key from tts_normalized_key
+            output_path: Destination path; the cached file's suffix is applied
+
+        Returns:
+            Tuple of (audio_path, duration), or None on a miss
+        """
+        if not self.index_path.exists():
+            return None
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    'SELECT exact_key FROM normalized WHERE norm_key = ? AND created_at + ttl > ?',
+                    (normalized_key, time.time())
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return self.get(row[0], output_path) if row else None
+
+    def put(self, key: str, audio_path: Path, duration: float, normalized_key: Optional[str] = None):
+        """Store generated audio under a cache key.
+
+        Args:
+            key: Cache key from tts_cache_key
+            audio_path: Generated audio file
+            duration: Audio duration in seconds
+            normalized_key: Cache key from tts_normalized_key to index the entry under
+        """
+        meta_path = self._meta_path(key)
+        cached = meta_path.with_name(key + Path(audio_path).suffix)
+        # Cache is an optimization only - ignore write failures
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(cached.name + '.tmp')
+            tmp.unlink(missing_ok=True)
+            _link_or_copy(Path(audio_path), tmp)
+            os.replace(tmp, cached)
+            # The sidecar is written last, so it only exists for complete entries
+            dump_json({'file': cached.name, 'duration': duration, 'created_at': time.time()},
+                      meta_path)
+            self._evict()
+        except OSError as e:
+            print(f"Warning: Could not save TTS audio cache entry: {e}")
+            return
+
+        if normalized_key:
+            try:
+                with closing(self._connect()) as conn, conn:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO normalized (norm_key, exact_key, created_at, ttl) '
+                        'VALUES (?, ?, ?, ?)',
+                        (normalized_key, key, time.time(), self.ttl_seconds)
+                    )
+                    conn.execute('DELETE FROM normalized WHERE created_at + ttl <= ?', (time.time(),))
+            except sqlite3.Error as e:
+                print(f"Warning: Could not update TTS cache index: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the normalized-text index, creating it if needed."""
+        conn = sqlite3.connect(str(self.index_path))
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS normalized ('
+            'norm_key TEXT PRIMARY KEY, exact_key TEXT, created_at REAL, ttl REAL)'
+        )
+        return conn
+
+    def _meta_path(self, key: str) -> Path:
+        """Get the sidecar path for a cache key."""
+        return self.cache_dir / key[:2] / f'{key}.json'
+
+    def _evict(self):
+        """Remove the least recently used entries beyond ``max_entries``."""
+        entries = sorted(self.cache_dir.glob('*/*.json'), key=lambda f: f.stat().st_mtime)
+        for meta_path in entries[:-self.max_entries]:
+            for old in meta_path.parent.glob(meta_path.stem + '.*'):
+                old.unlink(missing_ok=True)
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """Hard-link ``src`` to ``dst``, copying when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)